@@ -221,7 +221,8 @@ class EmotionWriter:
             prompt += f"\n\n【前情提要】\n{summary}"
 
         # Step 2: 流式API调用
-        full_content = ""
+        # 流式片段先收集到列表，结束时一次拼接
+        content_parts: List[str] = []
         try:
             logger.debug(f"Calling LLM in stream mode for chapter {chapter_num}")
 
@@ -251,7 +252,7 @@ class EmotionWriter:
                     chapter_content = response.get('content', response.get('text', ''))
                 else:
                     chapter_content = str(response)
-                full_content = chapter_content
+                content_parts.append(chapter_content)
                 yield chapter_content, None
             else:
                 # 迭代流式响应
@@ -270,13 +271,13 @@ class EmotionWriter:
                         chunk_text = chunk.get('content', chunk.get('text', ''))
 
                     if chunk_text:
-                        full_content += chunk_text
+                        content_parts.append(chunk_text)
                         yield chunk_text, None
 
         except Exception as e:
             logger.error(f"LLM stream call failed: {e}")
             error_msg = f"\n[错误: {str(e)}]"
-            full_content += error_msg
+            content_parts.append(error_msg)
             yield error_msg, None
 
             # 返回错误结果
@@ -284,12 +285,12 @@ class EmotionWriter:
                 "success": False,
                 "error": str(e),
                 "chapter": chapter_num,
-                "content": full_content
+                "content": "".join(content_parts)
             }
             return
 
         # Step 3: 后处理 - 清理不完整的句子
-        chapter_content = self._clean_incomplete_sentences(full_content)
+        chapter_content = self._clean_incomplete_sentences("".join(content_parts))
 
         # Step 4: 计算情绪值
         emotion_result = self.emotion_tracker.track_chapter_emotion(
@@ -4,11 +4,65 @@ Reviewer Agent
 """
 
 import os
-import json
 import re
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 
+from core.json_io import json_loads
+
+
+@lru_cache(maxsize=256)
+def _terms_pattern(terms: Tuple[str, ...]) -> "re.Pattern":
+    """编译词条交替模式（长词条优先），同一组词条跨章节复用"""
+    alternation = "|".join(re.escape(t) for t in terms)
+    return re.compile(f"(?=({alternation}))")
+
+
+def _find_terms(content: str, terms) -> set:
+    """
+    单次扫描找出 content 中出现的所有词条（多模式匹配）
+
+    用零宽前瞻在每个位置尝试最长词条，再把命中词条中包含的短词条一并计入，
+    结果与逐个 `term in content` 相同，但只遍历正文一次。
+    """
+    terms = set(terms)
+    nonempty = {t for t in terms if t}
+    if not nonempty:
+        return terms
+
+    # 先按长度再按字典序排序，保证同一组词条得到同一个缓存键
+    pattern = _terms_pattern(tuple(sorted(nonempty, key=lambda t: (-len(t), t))))
+    found = {m.group(1) for m in pattern.finditer(content)}
+    found.update(terms - nonempty)
+
+    # 较短词条若是命中词条的子串，也必然出现在正文中
+    for term in terms - found:
+        if any(term in hit for hit in found):
+            found.add(term)
+    return found
+
+
+def _read_text_tail(path: str, max_chars: int = 1000, max_bytes: int = 4000) -> str:
+    """
+    只读取文件末尾 max_bytes 字节并返回最后 max_chars 个字符
+
+    seek 位置可能落在多字节 UTF-8 字符中间，先跳过开头的续字节（0b10xxxxxx）对齐到字符边界。
+    """
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        start = max(0, size - max_bytes)
+        f.seek(start)
+        data = f.read()
+
+    if start > 0:
+        offset = 0
+        while offset < len(data) and data[offset] & 0xC0 == 0x80:
+            offset += 1
+        data = data[offset:]
+    return data.decode("utf-8", errors="replace")[-max_chars:]
+
 
 @dataclass
 class ReviewResult:
@@ -46,6 +100,8 @@ class ReviewerAgent:
         self.llm = llm_client
         self.project_dir = project_dir
         self.chapters_dir = os.path.join(project_dir, "chapters")
+        # 文件缓存: path -> ((mtime_ns, size), 解析结果)，审查多章时静态文件只解析一次
+        self._file_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
 
     def review_chapter(self, chapter_number: int) -> ReviewResult:
         """
@@ -67,6 +123,8 @@ class ReviewerAgent:
 
         # 2. 加载上下文
         context = self._load_context(chapter_number)
+        # 情节点、角色、姓名各项检查的词条合并为一次扫描，各评估项共用结果
+        context["found_terms"] = _find_terms(chapter_content, self._review_terms(context))
 
         # 3. 执行各项评估
         print("   正在评估情节连贯性...")
@@ -162,9 +220,6 @@ class ReviewerAgent:
             self.chapters_dir, f"chapter-{chapter_number:03d}.md"
         )
 
-        if not os.path.exists(chapter_file):
-            return None
-
         try:
             with open(chapter_file, "r", encoding="utf-8") as f:
                 return f.read()
@@ -176,49 +231,163 @@ class ReviewerAgent:
         context = {}
 
         # 加载章节规格
+        # 文件不存在时直接跳过（不先 exists 再打开，缓存命中时只有一次 stat）
         chapter_list_file = os.path.join(self.project_dir, "chapter-list.json")
-        if os.path.exists(chapter_list_file):
-            with open(chapter_list_file, "r", encoding="utf-8") as f:
-                chapters = json.load(f)
-                for ch in chapters:
-                    if ch["chapter_number"] == chapter_number:
-                        context["chapter_spec"] = ch
-                        break
+        try:
+            # 章节号索引与关键词随文件缓存，只在 chapter-list.json 变化时重建
+            chapters_by_number = self._read_cached(chapter_list_file, self._parse_chapter_list)
+            if chapter_number in chapters_by_number:
+                context["chapter_spec"] = chapters_by_number[chapter_number]
+        except FileNotFoundError:
+            pass
 
         # 加载角色设定
         characters_file = os.path.join(self.project_dir, "characters.json")
-        if os.path.exists(characters_file):
-            with open(characters_file, "r", encoding="utf-8") as f:
-                context["characters"] = json.load(f)
+        try:
+            # 角色索引与特征词随文件缓存，只在 characters.json 变化时重建
+            (
+                context["characters"],
+                context["characters_by_name"],
+                context["character_traits"],
+            ) = self._read_cached(characters_file, self._parse_characters)
+        except FileNotFoundError:
+            pass
 
         # 加载大纲
         outline_file = os.path.join(self.project_dir, "outline.md")
-        if os.path.exists(outline_file):
-            with open(outline_file, "r", encoding="utf-8") as f:
-                context["outline"] = f.read()
+        try:
+            context["outline"] = self._read_cached(outline_file, lambda raw: raw.decode("utf-8"))
+        except FileNotFoundError:
+            pass
 
-        # 加载前一章节
+        # 加载前一章节结尾（衔接只需要末尾部分，不读取整章）
         if chapter_number > 1:
             prev_file = os.path.join(
                 self.chapters_dir, f"chapter-{chapter_number - 1:03d}.md"
             )
-            if os.path.exists(prev_file):
-                with open(prev_file, "r", encoding="utf-8") as f:
-                    context["previous_chapter"] = f.read()
+            try:
+                context["previous_chapter_tail"] = _read_text_tail(prev_file)
+            except FileNotFoundError:
+                pass
 
         return context
 
+    def _read_cached(self, path: str, parser) -> Any:
+        """按 (mtime, size) 缓存文件解析结果，文件未变化时直接返回缓存"""
+        st = os.stat(path)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._file_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        with open(path, "rb") as f:
+            value = parser(f.read())
+        self._file_cache[path] = (key, value)
+        return value
+
+    @classmethod
+    def _parse_chapter_list(cls, raw: bytes) -> Dict[int, Dict[str, Any]]:
+        """解析 chapter-list.json 为章节号索引，并预先切分情节点/概要关键词"""
+        by_number = {}
+        for ch in json_loads(raw):
+            number = ch.get("chapter_number")
+            if number in by_number:
+                continue
+            ch["_keywords"] = cls._extract_point_keywords(ch)
+            ch["_summary_keywords"] = ch.get("summary", "").split()[:3]
+            by_number[number] = ch
+        return by_number
+
+    @classmethod
+    def _parse_characters(cls, raw: bytes) -> Tuple[Any, Dict[str, Dict[str, Any]], Dict[str, Tuple[bool, List[str]]]]:
+        """解析 characters.json，同时建立角色索引和特征词表"""
+        characters = json_loads(raw)
+        by_name = cls._index_characters(characters)
+        return characters, by_name, cls._index_traits(by_name)
+
+    @staticmethod
+    def _index_characters(characters: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """角色名 -> 角色设定（同名取第一个）"""
+        if isinstance(characters, dict):
+            characters = characters.get("characters", [])
+        by_name = {}
+        for char in characters:
+            if isinstance(char, dict):
+                by_name.setdefault(char.get("name"), char)
+        return by_name
+
+    @staticmethod
+    def _index_traits(by_name: Dict[str, Dict[str, Any]]) -> Dict[str, Tuple[bool, List[str]]]:
+        """角色名 -> (是否有性格设定, 前两个性格关键词（长度>2）)"""
+        traits = {}
+        for name, char in by_name.items():
+            personality = char.get("personality", "")
+            keywords = [t for t in personality.split()[:2] if len(t) > 2] if personality else []
+            traits[name] = (bool(personality), keywords)
+        return traits
+
+    @staticmethod
+    def _extract_point_keywords(chapter_spec: Dict[str, Any]) -> List[List[str]]:
+        """提取每个关键情节点的前两个关键词（长度>2）"""
+        return [
+            [kw for kw in point.split()[:2] if len(kw) > 2]
+            for point in chapter_spec.get("key_plot_points", [])
+        ]
+
+    def _plot_keywords(self, chapter_spec: Dict[str, Any]) -> Tuple[List[List[str]], List[str]]:
+        """情节点关键词与概要关键词（优先使用加载上下文时预先切分的结果）"""
+        point_keywords = chapter_spec.get("_keywords")
+        if point_keywords is None:
+            point_keywords = self._extract_point_keywords(chapter_spec)
+        summary_keywords = chapter_spec.get("_summary_keywords")
+        if summary_keywords is None:
+            summary_keywords = chapter_spec.get("summary", "").split()[:3]
+        return point_keywords, summary_keywords
+
+    def _involved_traits(self, context: Dict[str, Any]) -> Dict[str, Tuple[bool, List[str]]]:
+        """本章出场且有设定的角色 -> (是否有性格设定, 特征词)"""
+        character_traits = context.get("character_traits")
+        if character_traits is None:
+            character_traits = self._index_traits(
+                self._index_characters(context.get("characters", []))
+            )
+        involved = context.get("chapter_spec", {}).get("characters_involved", [])
+        return {
+            name: character_traits[name] for name in set(involved) if name in character_traits
+        }
+
+    def _known_names(self, context: Dict[str, Any]) -> set:
+        """角色设定中的全部姓名"""
+        characters_by_name = context.get("characters_by_name")
+        if characters_by_name is None:
+            characters_by_name = self._index_characters(context.get("characters", []))
+        return {name for name in characters_by_name if name}
+
+    def _review_terms(self, context: Dict[str, Any]) -> List[str]:
+        """汇总各评估项需要在正文中查找的词条"""
+        point_keywords, summary_keywords = self._plot_keywords(context.get("chapter_spec", {}))
+        terms = [kw for kws in point_keywords for kw in kws] + summary_keywords
+        for name, (_, traits) in self._involved_traits(context).items():
+            terms.append(name)
+            terms.extend(traits)
+        terms.extend(self._known_names(context))
+        return terms
+
+    @staticmethod
+    def _scan_terms(content: str, context: Dict[str, Any], terms) -> set:
+        """复用 review_chapter 的合并扫描结果，单独调用评估项时才自行扫描"""
+        found = context.get("found_terms")
+        if found is not None:
+            return found
+        return _find_terms(content, terms)
+
     def _load_progress(self) -> Optional[Dict[str, Any]]:
         """加载进度文件"""
         progress_file = os.path.join(self.project_dir, "novel-progress.txt")
 
-        if not os.path.exists(progress_file):
-            return None
-
         try:
-            with open(progress_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except:
+            return self._read_cached(progress_file, json_loads)
+        except (OSError, ValueError):
             return None
 
     def _evaluate_plot_coherence(self, content: str, context: Dict[str, Any]) -> float:
@@ -226,14 +395,20 @@ class ReviewerAgent:
         chapter_spec = context.get("chapter_spec", {})
         score = 8.0  # 基础分
 
-        # 检查关键情节点
         key_points = chapter_spec.get("key_plot_points", [])
+        summary = chapter_spec.get("summary", "")
+        point_keywords, summary_keywords = self._plot_keywords(chapter_spec)
+
+        # 情节点关键词与概要关键词一次扫描
+        found = self._scan_terms(
+            content, context, [kw for kws in point_keywords for kw in kws] + summary_keywords
+        )
+
+        # 检查关键情节点
         if key_points:
-            covered = 0
-            for point in key_points:
-                keywords = point.split()[:2]
-                if any(kw in content for kw in keywords if len(kw) > 2):
-                    covered += 1
+            covered = sum(
+                1 for kws in point_keywords if any(kw in found for kw in kws)
+            )
 
             coverage = covered / len(key_points)
             if coverage < 0.5:
@@ -244,10 +419,8 @@ class ReviewerAgent:
                 score += 0.5
 
         # 检查章节概要匹配度（简化）
-        summary = chapter_spec.get("summary", "")
         if summary:
-            summary_keywords = summary.split()[:3]
-            matches = sum(1 for kw in summary_keywords if kw in content)
+            matches = sum(1 for kw in summary_keywords if kw in found)
             if matches < len(summary_keywords) * 0.5:
                 score -= 0.5
 
@@ -257,27 +430,32 @@ class ReviewerAgent:
         self, content: str, context: Dict[str, Any]
     ) -> float:
         """评估角色一致性"""
-        characters = context.get("characters", [])
         chapter_spec = context.get("chapter_spec", {})
         score = 8.0
 
         involved = chapter_spec.get("characters_involved", [])
+        char_traits = self._involved_traits(context)
+
+        # 角色名与特征词一次扫描
+        found = self._scan_terms(
+            content,
+            context,
+            list(char_traits) + [t for _, traits in char_traits.values() for t in traits],
+        )
 
         for char_name in involved:
-            char = next((c for c in characters if c["name"] == char_name), None)
-            if not char:
+            if char_name not in char_traits:
                 continue
 
             # 检查角色名是否出现
-            if char_name not in content:
+            if char_name not in found:
                 score -= 1.0
                 continue
 
             # 检查角色特征词（简化）
-            personality = char.get("personality", "")
-            if personality:
-                traits = personality.split()[:2]
-                if not any(trait in content for trait in traits if len(trait) > 2):
+            has_personality, traits = char_traits[char_name]
+            if has_personality:
+                if not any(trait in found for trait in traits):
                     score -= 0.3
 
         return max(1.0, min(10.0, score))
@@ -582,22 +760,11 @@ class ReviewerAgent:
     ) -> float:
         """评估姓名一致性"""
         score = 8.0
-        characters = context.get("characters", {})
-
-        if isinstance(characters, dict):
-            char_list = characters.get("characters", [])
-        else:
-            char_list = characters if isinstance(characters, list) else []
-
-        known_names = set()
-        for char in char_list:
-            if isinstance(char, dict):
-                name = char.get("name", "")
-                if name:
-                    known_names.add(name)
+        known_names = self._known_names(context)
+        found = self._scan_terms(content, context, known_names)
 
         for name in known_names:
-            if name in content:
+            if name in found:
                 surname_variants = self._find_name_variants(content, name)
                 if surname_variants:
                     score -= 2.0
@@ -6,6 +6,8 @@ SeniorEditorAgent - 起点金牌资深编辑「锐评官」
 import os
 import json
 import re
+import heapq
+from collections import Counter
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -96,10 +98,22 @@ class SeniorEditorAgent:
         (r"双标|主角.{0,5}杀人.{0,5}有理|配角.{0,5}该死", "双标毒点"),
     ]
 
+    _YEAR_RE = re.compile(r"(\d+)年前")
+
+    # 悬念钩子：单字符用一次 Counter 统计，多字符逐个 count
+    HOOK_SINGLE_CHARS = ("?", "？")
+    HOOK_MULTI_CHARS = ("...", "悬念", "究竟", "难道", "竟然")
+
+    # 逐章分析关键词（类级常量，避免每章重建列表）
+    CHAPTER_HOOK_KEYWORDS = ("?", "？", "...", "悬念", "究竟", "难道", "竟然", "出乎意料")
+    CHAPTER_CONFLICT_KEYWORDS = ("冲突", "战斗", "危机", "困境", "敌人")
+    CHAPTER_EMOTION_KEYWORDS = ("愤怒", "悲伤", "喜悦", "兴奋", "震撼", "感动")
+
     def __init__(self, llm_client, project_dir: str):
         self.llm = llm_client
         self.project_dir = Path(project_dir)
         self.chapters_dir = self.project_dir / "chapters"
+        self._all_text_cache: Optional[Tuple[Dict[int, str], str]] = None
         self._load_project_info()
 
     def _load_project_info(self):
@@ -168,14 +182,20 @@ class SeniorEditorAgent:
         dimensions.append(commercial_dim)
 
         chapter_analyses = self._analyze_chapters(chapters_content)
+        self._all_text_cache = None
         overall_score = self._calculate_weighted_score(dimensions)
         predicted_retention = self._predict_retention(chapter_analyses, dimensions)
-        contract_grade = self._determine_contract_grade(overall_score, dimensions)
-        verdict = self._generate_verdict(overall_score, contract_grade, dimensions)
-        fatal_flaws = self._identify_fatal_flaws(dimensions)
+        fatal_issues, severe_issues = self._partition_issues(dimensions)
+        contract_grade = self._determine_contract_grade(
+            overall_score, len(fatal_issues)
+        )
+        verdict = self._generate_verdict(overall_score, contract_grade, fatal_issues)
+        fatal_flaws = self._identify_fatal_flaws(severe_issues)
         strengths = self._extract_strengths(dimensions)
         improvement_plan = self._create_improvement_plan(dimensions)
-        recommendations = self._generate_recommendations(dimensions, chapter_analyses)
+        recommendations = self._generate_recommendations(
+            fatal_issues, chapter_analyses
+        )
         editor_note = self._write_editor_note(overall_score, contract_grade, dimensions)
 
         report = SeniorEditorReport(
@@ -204,20 +224,38 @@ class SeniorEditorAgent:
         if not self.chapters_dir.exists():
             return chapters
 
-        for file in sorted(self.chapters_dir.glob("chapter-*.md")):
-            match = re.search(r"chapter-(\d+)", file.name)
-            if match:
-                num = int(match.group(1))
-                if chapter_range:
-                    if num < chapter_range[0] or num > chapter_range[1]:
-                        continue
-                try:
-                    chapters[num] = file.read_text(encoding="utf-8")
-                except:
-                    pass
+        # 按章节号数值排序（chapter-10 排在 chapter-2 之后），避免逐个构造 Path
+        with os.scandir(self.chapters_dir) as it:
+            entries = [
+                (int(e.name[8:-3]), e.path)
+                for e in it
+                if e.name.startswith("chapter-")
+                and e.name.endswith(".md")
+                and e.name[8:-3].isdigit()
+            ]
+        entries.sort()
+
+        for num, path in entries:
+            if chapter_range:
+                if num < chapter_range[0] or num > chapter_range[1]:
+                    continue
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    chapters[num] = f.read()
+            except:
+                pass
 
         return chapters
 
+    def _get_all_text(self, chapters: Dict[int, str]) -> str:
+        """拼接全文；同一份 chapters 只拼接一次，供各评估维度复用"""
+        cached = self._all_text_cache
+        if cached is not None and cached[0] is chapters:
+            return cached[1]
+        all_text = "\n".join(chapters.values())
+        self._all_text_cache = (chapters, all_text)
+        return all_text
+
     def _load_characters(self) -> Dict[str, Any]:
         """加载角色设定"""
         char_file = self.project_dir / "characters.json"
@@ -241,20 +279,11 @@ class SeniorEditorAgent:
         return {}
 
     def _evaluate_opening(self, chapters: Dict[int, str]) -> ReviewDimension:
-        """评估开篇抓人度"""
+        """评估开篇抓人度（chapters 非空由 review_novel 保证）"""
         issues = []
         strengths = []
         score = 8.0
 
-        if not chapters:
-            return ReviewDimension(
-                "开篇抓人",
-                5.0,
-                self.DIMENSION_WEIGHTS["开篇抓人"],
-                [{"type": "fatal", "message": "无法加载章节内容"}],
-                [],
-            )
-
         ch1 = chapters.get(1, "")
         ch2 = chapters.get(2, "")
         ch3 = chapters.get(3, "")
@@ -296,8 +325,11 @@ class SeniorEditorAgent:
             )
             score -= 1.0
 
-        hook_indicators = ["?", "？", "...", "悬念", "究竟", "难道", "竟然"]
-        chapter1_hooks = sum(ch1.count(ind) for ind in hook_indicators) if ch1 else 0
+        chapter1_hooks = 0
+        if ch1:
+            char_counts = Counter(ch1)
+            chapter1_hooks = sum(char_counts[ch] for ch in self.HOOK_SINGLE_CHARS)
+            chapter1_hooks += sum(ch1.count(ind) for ind in self.HOOK_MULTI_CHARS)
         if chapter1_hooks < 2:
             issues.append({"type": "minor", "message": "第1章悬念钩子不足，建议增加"})
             score -= 0.5
@@ -330,7 +362,7 @@ class SeniorEditorAgent:
         strengths = []
         score = 8.0
 
-        all_text = "\n".join(chapters.values())
+        all_text = self._get_all_text(chapters)
 
         realm_keywords = [
             "炼气",
@@ -381,17 +413,22 @@ class SeniorEditorAgent:
                     )
                     score -= 2.0
 
-        year_refs = re.findall(r"(\d+)年前", all_text)
-        if year_refs:
-            years = [int(y) for y in year_refs]
-            if max(years) - min(years) > 10:
-                issues.append(
-                    {
-                        "type": "warning",
-                        "message": f"时间参考矛盾：{min(years)}年前 vs {max(years)}年前",
-                    }
-                )
-                score -= 1.0
+        # 单次扫描同时跟踪最早/最晚年份，不物化匹配列表
+        min_year, max_year = None, None
+        for m in self._YEAR_RE.finditer(all_text):
+            year = int(m.group(1))
+            if min_year is None or year < min_year:
+                min_year = year
+            if max_year is None or year > max_year:
+                max_year = year
+        if min_year is not None and max_year - min_year > 10:
+            issues.append(
+                {
+                    "type": "warning",
+                    "message": f"时间参考矛盾：{min_year}年前 vs {max_year}年前",
+                }
+            )
+            score -= 1.0
 
         return ReviewDimension(
             name="逻辑自洽",
@@ -451,7 +488,7 @@ class SeniorEditorAgent:
         strengths = []
         score = 8.0
 
-        all_text = "\n".join(chapters.values())
+        all_text = self._get_all_text(chapters)
         total_words = len(all_text)
 
         # 分析章节类型分布
@@ -539,7 +576,7 @@ class SeniorEditorAgent:
         strengths = []
         score = 8.0
 
-        all_text = "\n".join(chapters.values())
+        all_text = self._get_all_text(chapters)
 
         protagonist = None
         char_list = []
@@ -612,10 +649,10 @@ class SeniorEditorAgent:
         strengths = []
         score = 7.0
 
-        all_text = "\n".join(chapters.values())
+        all_text = self._get_all_text(chapters)
 
         trendy_keywords = ["稳健", "苟道", "模拟器", "克系", "诡异", "飞升", "系统"]
-        trendy_count = sum(1 for kw in trendy_keywords if kw in all_text)
+        trendy_count = sum(kw in all_text for kw in trendy_keywords)
         if trendy_count > 0:
             strengths.append(f"融入当前流行元素({trendy_count}个)")
             score += 0.5
@@ -637,25 +674,16 @@ class SeniorEditorAgent:
         """逐章分析"""
         analyses = []
 
+        hook_keywords = self.CHAPTER_HOOK_KEYWORDS
+        conflict_keywords = self.CHAPTER_CONFLICT_KEYWORDS
+        emotion_keywords = self.CHAPTER_EMOTION_KEYWORDS
+
         for num, content in sorted(chapters.items()):
             word_count = len(content)
 
-            hook_keywords = [
-                "?",
-                "？",
-                "...",
-                "悬念",
-                "究竟",
-                "难道",
-                "竟然",
-                "出乎意料",
-            ]
-            hook_present = any(kw in content[-500:] for kw in hook_keywords)
-
-            conflict_keywords = ["冲突", "战斗", "危机", "困境", "敌人"]
+            tail = content[-500:]
+            hook_present = any(kw in tail for kw in hook_keywords)
             conflict_present = any(kw in content for kw in conflict_keywords)
-
-            emotion_keywords = ["愤怒", "悲伤", "喜悦", "兴奋", "震撼", "感动"]
             emotion_score = min(10, sum(content.count(kw) for kw in emotion_keywords))
 
             if word_count < 1500:
@@ -696,19 +724,38 @@ class SeniorEditorAgent:
         base_retention += (opening_score - 5) * 2
 
         if analyses:
-            hook_rate = sum(1 for a in analyses if a.hook_present) / len(analyses)
+            hook_rate = sum(a.hook_present for a in analyses) / len(analyses)
             base_retention += hook_rate * 10
 
         return min(95, max(5, base_retention))
 
-    def _determine_contract_grade(
-        self, score: float, dimensions: List[ReviewDimension]
-    ) -> str:
-        """确定签约等级"""
-        fatal_count = sum(
-            1 for d in dimensions for i in d.issues if i.get("type") == "fatal"
-        )
+    def _partition_issues(
+        self, dimensions: List[ReviewDimension]
+    ) -> Tuple[
+        List[Tuple[ReviewDimension, Dict[str, Any]]],
+        List[Tuple[ReviewDimension, Dict[str, Any]]],
+    ]:
+        """
+        一次遍历按严重程度划分问题
 
+        Returns:
+            (fatal_issues, severe_issues): 均为 (维度, 问题) 列表，保持原始顺序；
+            severe_issues 同时包含 fatal 与 critical
+        """
+        fatal_issues = []
+        severe_issues = []
+        for dim in dimensions:
+            for issue in dim.issues:
+                issue_type = issue.get("type")
+                if issue_type == "fatal":
+                    fatal_issues.append((dim, issue))
+                    severe_issues.append((dim, issue))
+                elif issue_type == "critical":
+                    severe_issues.append((dim, issue))
+        return fatal_issues, severe_issues
+
+    def _determine_contract_grade(self, score: float, fatal_count: int) -> str:
+        """确定签约等级"""
         if score >= 90 and fatal_count == 0:
             return "S级"
         elif score >= 80 and fatal_count <= 1:
@@ -721,14 +768,13 @@ class SeniorEditorAgent:
             return "D级"
 
     def _generate_verdict(
-        self, score: float, grade: str, dimensions: List[ReviewDimension]
+        self,
+        score: float,
+        grade: str,
+        fatal_issues: List[Tuple[ReviewDimension, Dict[str, Any]]],
     ) -> str:
         """生成一句话verdict"""
-        fatal_dims = [
-            d.name
-            for d in dimensions
-            if any(i.get("type") == "fatal" for i in d.issues)
-        ]
+        fatal_dims = list(dict.fromkeys(dim.name for dim, _ in fatal_issues))
 
         if score >= 90:
             return "优秀作品，具备爆款潜质"
@@ -744,22 +790,18 @@ class SeniorEditorAgent:
             return "不建议签约，建议重新构思"
 
     def _identify_fatal_flaws(
-        self, dimensions: List[ReviewDimension]
+        self, severe_issues: List[Tuple[ReviewDimension, Dict[str, Any]]]
     ) -> List[Dict[str, Any]]:
         """识别致命伤"""
-        flaws = []
-        for dim in dimensions:
-            for issue in dim.issues:
-                if issue.get("type") in ["fatal", "critical"]:
-                    flaws.append(
-                        {
-                            "dimension": dim.name,
-                            "type": issue.get("type"),
-                            "message": issue.get("message", ""),
-                            "suggestion": f"建议重新审视{dim.name}相关设定",
-                        }
-                    )
-        return flaws[:5]
+        return [
+            {
+                "dimension": dim.name,
+                "type": issue.get("type"),
+                "message": issue.get("message", ""),
+                "suggestion": f"建议重新审视{dim.name}相关设定",
+            }
+            for dim, issue in severe_issues[:5]
+        ]
 
     def _extract_strengths(self, dimensions: List[ReviewDimension]) -> List[str]:
         """提取优点"""
@@ -773,24 +815,20 @@ class SeniorEditorAgent:
     ) -> List[Dict[str, Any]]:
         """创建改进计划"""
         plan = []
-        priority = 1
 
-        sorted_dims = sorted(dimensions, key=lambda x: x.score)
-        for dim in sorted_dims:
-            if dim.score < 7 and dim.issues:
-                plan.append(
-                    {
-                        "priority": f"P{priority}",
-                        "dimension": dim.name,
-                        "current_score": f"{dim.score}/10",
-                        "target_score": "8/10",
-                        "issues": [i.get("message", "") for i in dim.issues[:3]],
-                        "actions": self._generate_actions(dim.name, dim.issues[:3]),
-                    }
-                )
-                priority += 1
-                if priority > 5:
-                    break
+        candidates = [d for d in dimensions if d.score < 7 and d.issues]
+        lowest = heapq.nsmallest(5, candidates, key=lambda x: x.score)
+        for priority, dim in enumerate(lowest, 1):
+            plan.append(
+                {
+                    "priority": f"P{priority}",
+                    "dimension": dim.name,
+                    "current_score": f"{dim.score}/10",
+                    "target_score": "8/10",
+                    "issues": [i.get("message", "") for i in dim.issues[:3]],
+                    "actions": self._generate_actions(dim.name, dim.issues[:3]),
+                }
+            )
 
         return plan
 
@@ -816,7 +854,9 @@ class SeniorEditorAgent:
         return actions
 
     def _generate_recommendations(
-        self, dimensions: List[ReviewDimension], analyses: List[ChapterAnalysis]
+        self,
+        fatal_issues: List[Tuple[ReviewDimension, Dict[str, Any]]],
+        analyses: List[ChapterAnalysis],
     ) -> Dict[str, Any]:
         """生成建议"""
         recs = {
@@ -827,14 +867,10 @@ class SeniorEditorAgent:
             "avoid_pitfalls": [],
         }
 
-        fatal_issues = []
-        for dim in dimensions:
-            for issue in dim.issues:
-                if issue.get("type") == "fatal":
-                    fatal_issues.append(issue.get("message", ""))
-
         if fatal_issues:
-            recs["avoid_pitfalls"] = fatal_issues[:5]
+            recs["avoid_pitfalls"] = [
+                issue.get("message", "") for _, issue in fatal_issues[:5]
+            ]
 
         if analyses:
             avg_words = sum(a.word_count for a in analyses) / len(analyses)
@@ -868,7 +904,8 @@ class SeniorEditorAgent:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M")
         report_file = reports_dir / f"review_{report.novel_title}_{timestamp}.md"
 
-        content = f"""# 【起点金牌编辑审稿报告】{report.novel_title}
+        parts = [
+            f"""# 【起点金牌编辑审稿报告】{report.novel_title}
 
 ## 📊 综合评级：{report.contract_grade}（{report.overall_score}/100）
 **一句话verdict**：{report.verdict}
@@ -882,49 +919,51 @@ class SeniorEditorAgent:
 | 维度 | 得分 | 状态 | 说明 |
 |------|------|------|------|
 """
+        ]
+        append = parts.append
 
         for dim in report.dimensions:
             status = "🟢" if dim.score >= 8 else "🟡" if dim.score >= 6 else "🔴"
-            content += f"| {dim.name} | {dim.score}/10 | {status} | {dim.strengths[0] if dim.strengths else '需改进'} |\n"
+            append(f"| {dim.name} | {dim.score}/10 | {status} | {dim.strengths[0] if dim.strengths else '需改进'} |\n")
 
-        content += f"""
+        append("""
 ---
 
 ## 🔴 致命伤（必须修改）
 
-"""
+""")
         if report.fatal_flaws:
             for i, flaw in enumerate(report.fatal_flaws, 1):
-                content += f"{i}. **[{flaw['dimension']}]** {flaw['message']}\n"
-                content += f"   - 建议：{flaw['suggestion']}\n\n"
+                append(f"{i}. **[{flaw['dimension']}]** {flaw['message']}\n")
+                append(f"   - 建议：{flaw['suggestion']}\n\n")
         else:
-            content += "✅ 未发现致命伤\n\n"
+            append("✅ 未发现致命伤\n\n")
 
-        content += f"""---
+        append("""---
 
 ## 🟢 亮点保持
 
-"""
+""")
         for strength in report.strengths:
-            content += f"- {strength}\n"
+            append(f"- {strength}\n")
 
-        content += f"""
+        append("""
 ---
 
 ## 📋 改进计划（按优先级排序）
 
-"""
+""")
         for item in report.improvement_plan:
-            content += f"### {item['priority']}: {item['dimension']}（{item['current_score']} → {item['target_score']}）\n\n"
-            content += f"**问题**：\n"
+            append(f"### {item['priority']}: {item['dimension']}（{item['current_score']} → {item['target_score']}）\n\n")
+            append("**问题**：\n")
             for issue in item["issues"]:
-                content += f"- {issue}\n"
-            content += f"\n**改进行动**：\n"
+                append(f"- {issue}\n")
+            append("\n**改进行动**：\n")
             for action in item["actions"]:
-                content += f"1. {action}\n"
-            content += "\n"
+                append(f"1. {action}\n")
+            append("\n")
 
-        content += f"""---
+        append(f"""---
 
 ## 📈 上架建议
 
@@ -934,11 +973,11 @@ class SeniorEditorAgent:
 
 ### ⚠️ 避雷指南
 
-"""
+""")
         for pitfall in report.recommendations["avoid_pitfalls"]:
-            content += f"- {pitfall}\n"
+            append(f"- {pitfall}\n")
 
-        content += f"""
+        append(f"""
 ---
 
 ## 💬 编辑寄语
@@ -950,10 +989,10 @@ class SeniorEditorAgent:
 *审稿时间：{datetime.now().strftime("%Y年%m月%d日 %H:%M")}*
 *审稿人：起点金牌资深编辑「锐评官」*
 *经验：8年+审稿，经手作品总收藏破千万*
-"""
+""")
 
         with open(report_file, "w", encoding="utf-8") as f:
-            f.write(content)
+            f.write("".join(parts))
 
         print(f"\n📄 审稿报告已保存: {report_file}")
 
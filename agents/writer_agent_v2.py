@@ -4,10 +4,19 @@ Writer Agent v2 - Pipeline Architecture
 """
 
 import os
+import re
+import atexit
+import asyncio
+import hashlib
+import subprocess
 import sys
 import json
 import logging
 import time
+import weakref
+from collections import Counter
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -15,6 +24,214 @@ from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# 项目根目录只在导入时加入一次 sys.path，供 core.* 导入使用
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from core.json_io import json_loads, json_dumps
+
+
+def _load_json_file(path: str) -> Any:
+    """读取JSON文件"""
+    with open(path, "rb") as f:
+        return json_loads(f.read())
+
+
+def _write_bytes(path: str, data: bytes, sync: bool = False):
+    """
+    整块写入文件：绕过缓冲IO，通常一次 write 系统调用即可完成
+
+    sync=True 时关闭前 fsync，保证随后的 os.replace 不会换上一个尚未落盘的空文件。
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        if sync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _dump_json_file(path: str, data: Any, sync: bool = False):
+    """写入JSON文件，保持2空格缩进、不转义中文"""
+    _write_bytes(path, json_dumps(data), sync=sync)
+
+
+def _load_text_file(path: str) -> str:
+    """读取文本文件"""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+# 各阶段系统提示词（跨章节保持逐字节一致，便于服务端前缀缓存）
+OUTLINE_SYSTEM_PROMPT = "你是专业的小说架构师，擅长将章节概要扩展为详细的大纲。"
+DRAFT_SYSTEM_PROMPT = "你是专业的小说作家，擅长创作生动、连贯的故事情节。"
+POLISH_SYSTEM_PROMPT = "你是专业的文学编辑，擅长优化文字流畅度、增强画面感、提升阅读体验。"
+FIX_SYSTEM_PROMPT = "你是专业的设定一致性编辑，擅长最小化修改修复设定错误。"
+
+# 各阶段提示词末尾的固定要求段落，只定义一次，构建提示词时直接追加
+# 批量大纲的内容与分段输出格式要求（静态文本）
+BATCH_OUTLINE_REQUIREMENTS = """
+## 大纲要求
+每章大纲包含：章节结构（开篇/发展/高潮/结尾钩子）、场景安排（3-5个场景，含地点、人物、事件、情绪）、节奏设计。
+
+## 输出格式（严格遵守）
+每章大纲用分段标记包裹，标记中的数字为章节号：
+[BEGIN_CHAPTER 章节号]
+（该章详细大纲）
+[END_CHAPTER 章节号]
+
+请直接输出各章大纲，不要添加额外解释。"""
+
+# 单章大纲的结构/场景/节奏要求（静态文本）
+OUTLINE_REQUIREMENTS = """
+## 大纲要求
+请输出以下结构的详细大纲：
+
+### 章节结构
+1. 开篇场景（300-500字）：如何吸引读者？
+2. 发展部分（1500-2000字）：情节如何推进？
+3. 高潮场景（800-1200字）：本章的核心冲突或转折点
+4. 结尾钩子（200-300字）：如何为下一章铺垫？
+
+### 场景安排
+列出3-5个具体场景，每个场景包含：
+- 场景地点
+- 出场人物
+- 核心事件
+- 情绪基调
+
+### 节奏设计
+- 爽点/亮点位置
+- 信息密度控制
+- 情绪曲线变化
+
+请直接输出详细大纲，不要添加额外解释。"""
+
+# 检查点写作要求（静态文本）
+CHECKPOINT_REQUIREMENTS = """
+## 写作要求
+1. 自然衔接已写内容
+2. 推进情节发展
+3. 保持角色性格一致
+4. 语言生动，有画面感
+5. 控制节奏，避免信息过载
+
+请直接输出这个检查点的内容，不要总结或解释。"""
+
+# 润色维度要求（静态文本）
+POLISH_REQUIREMENTS = """
+## 润色要求
+请从以下维度优化内容：
+
+### 1. 文字流畅度
+- 调整句式，避免重复
+- 优化段落衔接
+- 改善阅读节奏
+
+### 2. 画面感增强
+- 加强环境描写
+- 细化动作细节
+- 增强五感体验
+
+### 3. 情绪渲染
+- 强化情绪表达
+- 改善对话语气
+- 增强场景氛围
+
+### 4. 信息密度
+- 确保关键信息突出
+- 删除冗余描述
+- 平衡叙述与对话
+
+### 5. 网文特性
+- 确保爽点/亮点突出
+- 保持节奏紧凑
+- 章末留有钩子
+
+请直接输出润色后的完整章节内容，不要添加额外解释。"""
+
+# 检查点提示词中携带的已写草稿末尾字数
+CHECKPOINT_CONTEXT_CHARS = 2000
+
+# 非批量写作时累计多少章合并为一次 git 提交（其余在批次结束/进程退出时提交）
+GIT_COMMIT_EVERY = 10
+
+# git 提交在所有写作实例共用的单线程后台队列中按顺序执行，不阻塞下一章写作
+_GIT_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+# 写作实例弱引用集合：进程退出时补提交各实例剩余章节，不延长实例生命周期
+_GIT_WRITERS: "weakref.WeakSet[WriterAgentV2]" = weakref.WeakSet()
+
+
+def _close_git_queue():
+    """进程退出时：先等后台队列中的提交执行完，再同步提交剩余章节，避免同时争用 .git/index.lock"""
+    _GIT_EXECUTOR.shutdown(wait=True)
+    for writer in list(_GIT_WRITERS):
+        writer._flush_git_commits(sync=True)
+
+
+atexit.register(_close_git_queue)
+
+# 批量大纲响应的分段标记: [BEGIN_CHAPTER k] ... [END_CHAPTER k]
+_BATCH_SECTION_RE = re.compile(
+    r"\[BEGIN_CHAPTER\s+(\d+)\](.*?)\[END_CHAPTER\s+\1\]", re.DOTALL
+)
+
+# 地点/宗门检测模式（按优先级排列，取首个有匹配的模式的最后一处）
+_LOCATION_PATTERNS = tuple(
+    re.compile(p) for p in (
+        r"在([\u4e00-\u9fa5]+)",
+        r"来到([\u4e00-\u9fa5]+)",
+        r"前往([\u4e00-\u9fa5]+)",
+    )
+)
+_FACTION_PATTERNS = tuple(
+    re.compile(p) for p in (
+        r"加入([\u4e00-\u9fa5]+)",
+        r"进入([\u4e00-\u9fa5]+)",
+        r"拜入([\u4e00-\u9fa5]+)",
+    )
+)
+
+# 开篇诊断评级
+_DIAGNOSIS_GRADE_RE = re.compile(r'综合评级[：:]\s*([SABCDF])')
+_DIAGNOSIS_GRADE_FALLBACK_RE = re.compile(r'\n([SABCDF])级')
+
+# 境界突破动词（均为两字，零宽前瞻以取得所有可能重叠的出现位置）
+_REALM_VERB_RE = re.compile(r"(?=突破|晋升|晋级|达到|升至|踏入|进入)")
+
+
+@lru_cache(maxsize=8)
+def _realm_name_pattern(realms: Tuple[str, ...]) -> "re.Pattern":
+    """所有以层/期/境结尾的境界名合并为一个带边界的交替模式（长名优先）"""
+    alternation = "|".join(re.escape(r) for r in sorted(realms, key=len, reverse=True))
+    return re.compile(
+        rf"(?<![a-zA-Z\u4e00-\u9fa5])(?:{alternation})(?![a-zA-Z\u4e00-\u9fa5])"
+    )
+
+
+@lru_cache(maxsize=32)
+def _keyword_count_pattern(keywords: Tuple[str, ...]) -> Optional["re.Pattern"]:
+    """
+    多关键词单次扫描计数的模式；无法与逐个 str.count 等价时返回 None
+
+    用零宽前瞻在每个位置匹配关键词。只要没有关键词是另一个的前缀、
+    也没有关键词能与自身重叠，每处出现恰好被计数一次，结果与 str.count 相同。
+    """
+    unique = set(keywords)
+    if not unique or "" in unique:
+        return None
+    for kw in unique:
+        if any(kw[:i] == kw[-i:] for i in range(1, len(kw))):
+            return None
+        if any(other != kw and other.startswith(kw) for other in unique):
+            return None
+    alternation = "|".join(re.escape(kw) for kw in unique)
+    return re.compile(f"(?=({alternation}))")
+
 
 class PipelineStage(Enum):
     """管道阶段枚举"""
@@ -62,6 +279,23 @@ class WriterAgentV2:
         self.llm = llm_client
         self.project_dir = project_dir
         self.chapters_dir = os.path.join(project_dir, "chapters")
+        # 系统提示词缓存: 角色提示词 -> 角色提示词 + V7约束（会话内不变的稳定前缀）
+        self._system_prompt_cache: Dict[str, str] = {}
+        # 文件缓存: path -> ((mtime_ns, size), 解析结果)，避免每章重复解析同一批项目文件
+        self._file_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        # 批量预取的章节大纲: chapter_number -> 大纲文本
+        self._outline_cache: Dict[int, str] = {}
+        # 待提交的章节 (chapter_number, title)，每 GIT_COMMIT_EVERY 章合并为一次 git 提交
+        self._pending_commits: List[Tuple[int, str]] = []
+        _GIT_WRITERS.add(self)
+        self._in_batch = False
+        # 最近写完的章节正文，下一章取前章结尾时无需再读文件
+        self._last_chapter_number: Optional[int] = None
+        self._last_chapter_text: Optional[str] = None
+        # 开篇诊断结果缓存: 提示词摘要 -> LLM诊断文本（重写失败后复诊不再重复请求）
+        self._diagnosis_cache: Dict[str, str] = {}
+        # 进度中第一个 pending 章节的下标: (进度对象, 下标)，进度对象被重新加载后失效
+        self._pending_hint: Optional[Tuple[Dict[str, Any], Optional[int]]] = None
         self.v7_constraints = v7_constraints or self._load_v7_constraints()
 
         # 确保目录存在
@@ -81,77 +315,399 @@ class WriterAgentV2:
 
         logger.info(f"WriterAgentV2 initialized for project: {project_dir}")
 
-    def write_session(self) -> Dict[str, Any]:
-        """执行一次写作会话 - 兼容旧接口"""
-        import sys
-        sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+    def write_session(self, batch_size: int = 1) -> Dict[str, Any]:
+        """
+        执行一次写作会话 - 兼容旧接口
 
-        from core.progress_manager import ProgressManager
+        Args:
+            batch_size: 本次会话写作的章节数；大于1时走 write_batch，
+                        后续多章大纲合并为一次LLM请求
+        """
+        if batch_size > 1 and not self._in_batch:
+            return self.write_batch(batch_size)
 
         # 1. 加载进度
-        progress_mgr = ProgressManager(self.project_dir)
-        progress = progress_mgr.load_progress()
+        progress = self._load_progress_data()
 
         if not progress:
             return {"success": False, "error": "No progress file"}
 
-        if progress.completed_chapters >= progress.total_chapters:
+        completed = progress.get("completed_chapters", 0)
+        if completed >= progress.get("total_chapters", 0):
             return {"success": True, "status": "completed"}
 
         # 2. 获取下一章节
-        chapter_number = progress.completed_chapters + 1
+        chapter_number = completed + 1
 
         chapter_list_file = os.path.join(self.project_dir, "chapter-list.json")
-        if os.path.exists(chapter_list_file):
-            with open(chapter_list_file, "r", encoding="utf-8") as f:
-                chapters = json.load(f)
-            for ch in chapters:
-                if ch.get("chapter_number") == chapter_number:
-                    chapter_info = ch
-                    break
-        else:
+        try:
+            chapters = self._read_json(chapter_list_file)
+        except FileNotFoundError:
             return {"success": False, "error": "No chapter list"}
+        for ch in chapters:
+            if ch.get("chapter_number") == chapter_number:
+                chapter_info = ch
+                break
 
         print(f"\n   Chapter {chapter_number}: {chapter_info.get('title', 'Untitled')}")
 
+        # 标记为写作中（仅内存，随完成时的进度写入一并落盘）
+        entries = progress.get("chapters", [])
+        index = self._find_chapter_index(entries, chapter_number)
+        previous_status = None
+        if index is not None:
+            previous_status = entries[index].get("status")
+            entries[index]["status"] = "writing"
+
         # 3. 使用管道写作
         print(f"\n[Step 5] Writing chapter {chapter_number}...")
-        result = self.write_chapter(chapter_number)
+        try:
+            result = self.write_chapter(chapter_number)
+        finally:
+            # 进度对象即文件缓存中的对象：章节未被 _update_project_state 更新（失败/异常）时
+            # 恢复原状态，避免残留的 writing 随后续进度写入落盘
+            if index is not None and entries[index].get("status") == "writing":
+                entries[index]["status"] = previous_status
 
         if result.get("success"):
             print(f"\n[Step 7] Saved: chapter-{chapter_number:03d}.md")
 
-            # 4. 更新进度
+            # 4. 进度已在 _update_project_state 中更新
             word_count = result.get("word_count", 0)
-            progress_mgr.update_chapter_progress(
-                chapter_number,
-                status="completed",
-                word_count=word_count,
-                quality_score=7.0  # 默认评分
+
+            # 5. 记录待提交章节；批量写作时由批次统一提交，否则每 GIT_COMMIT_EVERY 章提交一次
+            self._pending_commits.append(
+                (chapter_number, chapter_info.get("title", f"第{chapter_number}章"))
             )
+            if not self._in_batch and len(self._pending_commits) >= GIT_COMMIT_EVERY:
+                self._flush_git_commits()
 
             return {"success": True, "chapter_number": chapter_number, "word_count": word_count}
         else:
             return {"success": False, "error": result.get("error", "Unknown error")}
 
+    def write_batch(self, batch_size: int = 3, max_concurrency: int = 3) -> Dict[str, Any]:
+        """
+        批量写作：一次LLM调用预取后续多章大纲，再逐章走完整管道
+
+        大纲只依赖章节列表中的元数据，不依赖前一章正文，因此可以合并请求；
+        合并响应中缺失的章节以最多 max_concurrency 个并发请求补齐。
+        草稿/润色仍按顺序执行以保证前后章衔接。
+        """
+        progress = self._load_progress_data()
+        if not progress:
+            return {"success": False, "error": "No progress file"}
+
+        start = progress.get("completed_chapters", 0) + 1
+        end = min(progress.get("total_chapters", 0), start + batch_size - 1)
+        if start > end:
+            return {"success": True, "status": "completed"}
+
+        chapter_infos = [
+            info for info in (self._load_chapter_info(n) for n in range(start, end + 1)) if info
+        ]
+        if len(chapter_infos) > 1:
+            self._prefetch_outlines(chapter_infos, max_concurrency)
+
+        results = []
+        self._in_batch = True
+        try:
+            for _ in chapter_infos:
+                result = self.write_session()
+                results.append(result)
+                if not result.get("success"):
+                    break
+        finally:
+            self._in_batch = False
+            self._flush_git_commits()
+
+        # 未用完的预取大纲丢弃，避免影响后续会话
+        self._outline_cache.clear()
+
+        return self._summarize_batch(results)
+
+    async def write_batch_async(self, batch_size: int = 3, max_concurrency: int = 3) -> Dict[str, Any]:
+        """
+        异步批量写作：并发生成后续多章大纲，再按顺序写作
+
+        大纲请求之间互不依赖，用 Semaphore 限制并发后通过 asyncio.gather 并行发出；
+        草稿依赖上一章结尾，仍按章节顺序逐章等待执行，同一时刻只有一章在更新进度。
+        """
+        progress = self._load_progress_data()
+        if not progress:
+            return {"success": False, "error": "No progress file"}
+
+        start = progress.get("completed_chapters", 0) + 1
+        end = min(progress.get("total_chapters", 0), start + batch_size - 1)
+        if start > end:
+            return {"success": True, "status": "completed"}
+
+        chapter_infos = [
+            info for info in (self._load_chapter_info(n) for n in range(start, end + 1)) if info
+        ]
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_outline(info: Dict[str, Any]):
+            async with semaphore:
+                outline = await asyncio.to_thread(self._generate_outline, info)
+            if outline:
+                self._outline_cache[info["chapter_number"]] = outline
+
+        print(f"  Generating outlines for {len(chapter_infos)} chapters concurrently...")
+        await asyncio.gather(*(fetch_outline(info) for info in chapter_infos))
+
+        results = []
+        self._in_batch = True
+        try:
+            for _ in chapter_infos:
+                result = await asyncio.to_thread(self.write_session)
+                results.append(result)
+                if not result.get("success"):
+                    break
+        finally:
+            self._in_batch = False
+            self._flush_git_commits()
+
+        self._outline_cache.clear()
+
+        return self._summarize_batch(results)
+
+    @staticmethod
+    def _summarize_batch(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """汇总批量写作结果，保留 write_session 的返回字段"""
+        written = [r.get("chapter_number") for r in results if r.get("success")]
+        summary = {
+            "success": bool(results) and all(r.get("success") for r in results),
+            "chapter_number": written[-1] if written else None,
+            "chapters": written,
+            "word_count": sum(r.get("word_count", 0) for r in results),
+            "results": results,
+        }
+        failed = next((r for r in results if not r.get("success")), None)
+        if failed:
+            summary["error"] = failed.get("error", "Unknown error")
+        return summary
+
+    def _flush_git_commits(self, sync: bool = False):
+        """
+        把累计写完的章节合并为一次 git 提交
+
+        仅当项目目录本身是 git 仓库时执行；提交放到后台队列执行，
+        进程退出时后台队列已关闭，以 sync=True 在当前线程直接提交。
+        git 不可用或提交失败只记录警告。
+        """
+        if not self._pending_commits:
+            return
+
+        pending, self._pending_commits = self._pending_commits, []
+        if not os.path.isdir(os.path.join(self.project_dir, ".git")):
+            return
+
+        numbers = [num for num, _ in pending]
+        if len(numbers) == 1:
+            subject = f"完成第{numbers[0]}章"
+        else:
+            subject = f"完成第{min(numbers)}-{max(numbers)}章"
+        body = "\n".join(f"- 第{num}章: {title}" for num, title in pending)
+        if sync:
+            self._run_git_commit(subject, body)
+        else:
+            _GIT_EXECUTOR.submit(self._run_git_commit, subject, body)
+
+    def _run_git_commit(self, subject: str, body: str):
+        """执行 git add/commit（在后台线程中运行）"""
+        try:
+            subprocess.run(
+                ["git", "-C", self.project_dir, "add",
+                 "chapters", "novel-progress.txt", "chapter-list.json"],
+                check=True, capture_output=True
+            )
+            subprocess.run(
+                ["git", "-C", self.project_dir, "commit", "-m", subject, "-m", body],
+                check=True, capture_output=True
+            )
+            print(f"  [Git] {subject}")
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.warning(f"Git commit failed: {e}")
+
+    def _load_progress_data(self) -> Optional[Dict[str, Any]]:
+        """加载进度文件（经文件缓存，本会话刚写入的进度直接命中内存）"""
+        progress_file = os.path.join(self.project_dir, "novel-progress.txt")
+        try:
+            return self._read_json(progress_file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to load progress: {e}")
+            return None
+
+    def _prefetch_outlines(self, chapter_infos: List[Dict[str, Any]], max_concurrency: int = 3):
+        """
+        一次LLM调用生成多章大纲，按分段标记拆分后写入 _outline_cache
+
+        合并请求失败或响应缺少部分章节时，缺失章节改为逐章请求并发补齐。
+        """
+        print(f"  Prefetching outlines for {len(chapter_infos)} chapters in one request...")
+
+        prompt = self._build_batch_outline_prompt(chapter_infos)
+        try:
+            response = self.llm.generate(
+                prompt=prompt,
+                temperature=0.7,
+                system_prompt=self._stable_system_prompt(OUTLINE_SYSTEM_PROMPT),
+                max_tokens=1000 * len(chapter_infos)
+            )
+        except Exception as e:
+            logger.warning(f"Batch outline generation failed: {e}")
+            response = ""
+
+        wanted = {info.get("chapter_number") for info in chapter_infos}
+        for match in _BATCH_SECTION_RE.finditer(response or ""):
+            chapter_number = int(match.group(1))
+            outline = match.group(2).strip()
+            if chapter_number in wanted and outline:
+                self._outline_cache[chapter_number] = outline
+
+        missing = [info for info in chapter_infos if info.get("chapter_number") not in self._outline_cache]
+        if not missing:
+            return
+
+        logger.warning(f"Batch outline missing chapters: {[info.get('chapter_number') for info in missing]}")
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(missing)))) as executor:
+            outlines = list(executor.map(self._generate_outline, missing))
+        for info, outline in zip(missing, outlines):
+            if outline:
+                self._outline_cache[info["chapter_number"]] = outline
+
+    def _generate_outline(self, chapter_info: Dict[str, Any]) -> Optional[str]:
+        """为单章生成大纲（供并发预取使用），失败返回 None"""
+        context = PipelineContext(
+            chapter_number=chapter_info["chapter_number"],
+            chapter_info=chapter_info,
+            project_dir=self.project_dir
+        )
+        prompt = self._build_outline_prompt(context, self._retrieve_rag_context(context))
+        try:
+            return self.llm.generate(
+                prompt=prompt,
+                temperature=0.7,
+                system_prompt=self._stable_system_prompt(OUTLINE_SYSTEM_PROMPT),
+                max_tokens=1000
+            )
+        except Exception as e:
+            logger.warning(f"Outline prefetch failed for chapter {context.chapter_number}: {e}")
+            return None
+
+    def _build_batch_outline_prompt(self, chapter_infos: List[Dict[str, Any]]) -> str:
+        """构建批量大纲提示词"""
+        parts = [f"请为小说的以下{len(chapter_infos)}个章节分别创建详细大纲。\n"]
+
+        for info in chapter_infos:
+            num = info.get("chapter_number")
+            parts.append(f"\n## 第{num}章（输出标记: [BEGIN_CHAPTER {num}] ... [END_CHAPTER {num}]）\n")
+            parts.append(f"- 标题: {info.get('title', f'第{num}章')}\n")
+            parts.append(f"- 概要: {info.get('summary', '暂无')}\n")
+            parts.append(f"- 字数目标: {info.get('word_count_target', 3000)}字\n")
+            parts.append("- 关键情节点（必须包含）:\n")
+            for point in info.get("key_plot_points", []):
+                parts.append(f"  - {point}\n")
+
+        parts.append(BATCH_OUTLINE_REQUIREMENTS)
+
+        return "".join(parts)
+
+    def _stable_system_prompt(self, role_prompt: str) -> str:
+        """
+        构建稳定的系统提示词：角色设定 + V7类型约束
+
+        V7约束在整个会话中不变，放在系统提示词中作为所有请求共享的前缀，
+        章节相关的可变内容全部留在用户提示词里，便于服务端命中前缀缓存。
+        """
+        cached = self._system_prompt_cache.get(role_prompt)
+        if cached is None:
+            cached = role_prompt
+            if self.v7_constraints:
+                cached += f"\n\n## 类型约束（必须严格遵守）\n{self.v7_constraints}\n"
+            self._system_prompt_cache[role_prompt] = cached
+        return cached
+
     def _load_v7_constraints(self) -> str:
         """从项目配置加载V7约束"""
         config_file = os.path.join(self.project_dir, "project-config.json")
-        if os.path.exists(config_file):
-            try:
-                with open(config_file, "r", encoding="utf-8") as f:
-                    config = json.load(f)
-                return config.get("v7_constraints", "")
-            except Exception as e:
-                logger.warning(f"Failed to load V7 constraints: {e}")
+        try:
+            config = self._read_json(config_file)
+            return config.get("v7_constraints", "")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to load V7 constraints: {e}")
         return ""
 
+    def _cached_read(self, path: str, loader) -> Any:
+        """按 (mtime, size) 缓存文件解析结果，文件未变化时直接返回缓存"""
+        st = os.stat(path)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._file_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        value = loader(path)
+        self._file_cache[path] = (key, value)
+        return value
+
+    def _read_json(self, path: str) -> Any:
+        """读取JSON文件（带缓存）"""
+        return self._cached_read(path, _load_json_file)
+
+    def _read_text(self, path: str) -> str:
+        """读取文本文件（带缓存）"""
+        return self._cached_read(path, _load_text_file)
+
+    @staticmethod
+    def _read_tail(path: str, max_chars: int = 500, window: int = 2048) -> str:
+        """读取文件末尾 max_chars 个字符（2KB窗口足够容纳500个中文字符）"""
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            f.seek(max(0, size - window))
+            tail = f.read().decode("utf-8", errors="ignore")
+        return tail[-max_chars:]
+
+    def _invalidate_cache(self, path: str):
+        """写入文件后使缓存失效"""
+        self._file_cache.pop(path, None)
+
+    def _write_json(self, path: str, data: Any):
+        """
+        原子写入JSON：先写临时文件并 fsync，再 os.replace，避免写到一半崩溃损坏文件
+
+        写入成功后直接以新的 (mtime, size) 缓存内存对象，下次读取无需重新解析。
+        """
+        tmp_path = path + ".tmp"
+        try:
+            _dump_json_file(tmp_path, data, sync=True)
+            os.replace(tmp_path, path)
+        except Exception:
+            self._invalidate_cache(path)
+            raise
+
+        st = os.stat(path)
+        self._file_cache[path] = ((st.st_mtime_ns, st.st_size), data)
+
+    @classmethod
+    def _apply_chapter_entry(cls, chapters: List[Dict[str, Any]], entry: Dict[str, Any]) -> bool:
+        """把单章状态更新应用到章节列表"""
+        index = cls._find_chapter_index(chapters, entry.get("chapter_number"))
+        if index is None:
+            return False
+        chapters[index].update(
+            (key, value) for key, value in entry.items() if key != "chapter_number"
+        )
+        return True
+
     def _init_core_components(self):
         """初始化核心组件"""
-        sys_path = os.path.dirname(os.path.dirname(__file__))
-        if sys_path not in os.sys.path:
-            os.sys.path.insert(0, sys_path)
-
         # 尝试加载 whitelist（从 writing_constraints.json）
         whitelist = self._load_faction_whitelist()
 
@@ -244,25 +800,25 @@ class WriterAgentV2:
         """加载宗门白名单"""
         whitelist = []
         constraints_file = os.path.join(self.project_dir, "writing_constraints.json")
-        if os.path.exists(constraints_file):
-            try:
-                with open(constraints_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    whitelist = data.get("faction_whitelist", [])
-            except Exception as e:
-                logger.warning(f"Failed to load whitelist: {e}")
+        try:
+            data = self._read_json(constraints_file)
+            whitelist = data.get("faction_whitelist", [])
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to load whitelist: {e}")
 
         # 如果没有，从 characters.json 或 world-rules.json 尝试加载
         if not whitelist:
             world_rules_file = os.path.join(self.project_dir, "world-rules.json")
-            if os.path.exists(world_rules_file):
-                try:
-                    with open(world_rules_file, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        factions = data.get("factions", {})
-                        whitelist = list(factions.keys())
-                except Exception as e:
-                    logger.warning(f"Failed to load factions: {e}")
+            try:
+                data = self._read_json(world_rules_file)
+                factions = data.get("factions", {})
+                whitelist = list(factions.keys())
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Failed to load factions: {e}")
 
         return whitelist
 
@@ -341,16 +897,14 @@ class WriterAgentV2:
     def _load_chapter_info(self, chapter_number: int) -> Optional[Dict[str, Any]]:
         """加载章节信息"""
         chapter_list_file = os.path.join(self.project_dir, "chapter-list.json")
-        if not os.path.exists(chapter_list_file):
-            return None
-        
         try:
-            with open(chapter_list_file, "r", encoding="utf-8") as f:
-                chapters = json.load(f)
+            chapters = self._read_json(chapter_list_file)
             
             for ch in chapters:
                 if ch.get("chapter_number") == chapter_number:
                     return ch
+        except FileNotFoundError:
+            return None
         except Exception as e:
             logger.error(f"Failed to load chapter info: {e}")
         
@@ -359,16 +913,17 @@ class WriterAgentV2:
     def _load_audit_feedback(self, chapter_number: int) -> str:
         """加载审核反馈（如果有）"""
         feedback_file = os.path.join(self.project_dir, f".chapter_{chapter_number}_audit_feedback.json")
-        if os.path.exists(feedback_file):
-            try:
-                with open(feedback_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    feedback = data.get("feedback", "")
-                    # 读取后删除，防止污染
-                    os.remove(feedback_file)
-                    return feedback
-            except Exception as e:
-                logger.warning(f"Failed to load audit feedback: {e}")
+        try:
+            with open(feedback_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                feedback = data.get("feedback", "")
+                # 读取后删除，防止污染
+                os.remove(feedback_file)
+                return feedback
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to load audit feedback: {e}")
         return ""
 
     def _inject_feedback_to_prompt(self, prompt: str, feedback: str) -> str:
@@ -387,6 +942,17 @@ class WriterAgentV2:
 
     def _handle_outline_stage(self, context: PipelineContext) -> Dict[str, Any]:
         """大纲阶段 - 生成章节详细大纲"""
+        # 批量预取过的大纲直接使用
+        cached_outline = self._outline_cache.pop(context.chapter_number, None)
+        if cached_outline:
+            print("  Using prefetched chapter outline...")
+            return {
+                "success": True,
+                "raw_outline": cached_outline,
+                "structured_outline": self._parse_outline(cached_outline),
+                "rag_context_used": False
+            }
+
         print("  Generating detailed chapter outline...")
         
         # 使用RAG检索相关上下文
@@ -400,7 +966,7 @@ class WriterAgentV2:
             outline = self.llm.generate(
                 prompt=prompt,
                 temperature=0.7,
-                system_prompt="你是专业的小说架构师，擅长将章节概要扩展为详细的大纲。",
+                system_prompt=self._stable_system_prompt(OUTLINE_SYSTEM_PROMPT),
                 max_tokens=1000
             )
             
@@ -437,60 +1003,95 @@ class WriterAgentV2:
         # 构建检查点写作提示词
         checkpoints = self._create_writing_checkpoints(outline, context.chapter_info)
         
-        draft_content = ""
+        # 草稿分片收集，结束时一次拼接；提示词只需要已写内容的末尾，单独维护一个有界尾部
+        draft_parts: List[str] = []
+        draft_tail = ""
         checkpoint_results = []
-        
-        for i, checkpoint in enumerate(checkpoints):
-            print(f"    Checkpoint {i+1}/{len(checkpoints)}: {checkpoint.get('target', 'Unknown')}")
-            
-            # 构建检查点提示词
-            prompt = self._build_checkpoint_prompt(
-                context, checkpoint, draft_content, rag_context
-            )
+
+        # 草稿边生成边落盘（流式），中断时可从自动保存文件恢复
+        draft_file = os.path.join(
+            self.chapters_dir, f"checkpoint-{context.chapter_number:03d}-draft.md"
+        )
+        with open(draft_file, "w", encoding="utf-8") as draft_out:
+            for i, checkpoint in enumerate(checkpoints):
+                print(f"    Checkpoint {i+1}/{len(checkpoints)}: {checkpoint.get('target', 'Unknown')}")
             
-            try:
-                # 调用LLM生成检查点内容
-                checkpoint_content = self.llm.generate(
-                    prompt=prompt,
-                    temperature=0.8,
-                    system_prompt="你是专业的小说作家，擅长创作生动、连贯的故事情节。",
-                    max_tokens=1500
+                # 构建检查点提示词
+                prompt = self._build_checkpoint_prompt(
+                    context, checkpoint, draft_tail, rag_context
                 )
+            
+                try:
+                    # 调用LLM生成检查点内容
+                    checkpoint_content = self._generate_to_file(
+                        draft_out,
+                        prompt=prompt,
+                        temperature=0.8,
+                        system_prompt=self._stable_system_prompt(DRAFT_SYSTEM_PROMPT),
+                        max_tokens=1500
+                    )
                 
-                # 添加到草稿
-                draft_content += checkpoint_content + "\n\n"
+                    # 添加到草稿
+                    piece = checkpoint_content + "\n\n"
+                    draft_parts.append(piece)
+                    draft_tail = (draft_tail + piece)[-CHECKPOINT_CONTEXT_CHARS:]
+                    draft_out.write("\n\n")
+                    draft_out.flush()
                 
-                checkpoint_results.append({
-                    "checkpoint_id": i + 1,
-                    "target": checkpoint.get("target"),
-                    "word_count": len(checkpoint_content),
-                    "success": True
-                })
+                    checkpoint_results.append({
+                        "checkpoint_id": i + 1,
+                        "target": checkpoint.get("target"),
+                        "word_count": len(checkpoint_content),
+                        "success": True
+                    })
                 
-                # 短暂暂停，避免API限流
-                time.sleep(0.5)
+                    # 短暂暂停，避免API限流
+                    time.sleep(0.5)
                 
-            except Exception as e:
-                logger.error(f"Checkpoint {i+1} failed: {e}")
-                checkpoint_results.append({
-                    "checkpoint_id": i + 1,
-                    "target": checkpoint.get("target"),
-                    "success": False,
-                    "error": str(e)
-                })
+                except Exception as e:
+                    logger.error(f"Checkpoint {i+1} failed: {e}")
+                    checkpoint_results.append({
+                        "checkpoint_id": i + 1,
+                        "target": checkpoint.get("target"),
+                        "success": False,
+                        "error": str(e)
+                    })
                 
-                # 优雅降级：使用简单回退
-                fallback_content = f"[检查点 {i+1}: {checkpoint.get('target', '部分')} - 因错误跳过]"
-                draft_content += fallback_content + "\n\n"
-        
+                    # 优雅降级：使用简单回退
+                    fallback_content = f"[检查点 {i+1}: {checkpoint.get('target', '部分')} - 因错误跳过]"
+                    piece = fallback_content + "\n\n"
+                    draft_parts.append(piece)
+                    draft_tail = (draft_tail + piece)[-CHECKPOINT_CONTEXT_CHARS:]
+                    draft_out.write(piece)
+
+        draft_content = "".join(draft_parts)
+
         return {
             "success": True,
             "draft_content": draft_content,
             "checkpoint_results": checkpoint_results,
             "total_word_count": len(draft_content),
-            "checkpoints_used": len(checkpoints)
+            "checkpoints_used": len(checkpoints),
+            "draft_file": draft_file
         }
 
+    def _generate_to_file(self, out, **kwargs) -> str:
+        """
+        调用LLM并把输出写入文件
+
+        客户端支持 generate_stream 时逐片写入，否则整段写入；返回完整文本。
+        """
+        if not hasattr(self.llm, "generate_stream"):
+            content = self.llm.generate(**kwargs)
+            out.write(content)
+            return content
+
+        pieces = []
+        for chunk in self.llm.generate_stream(**kwargs):
+            out.write(chunk)
+            pieces.append(chunk)
+        return "".join(pieces)
+
     def _handle_consistency_check_stage(self, context: PipelineContext) -> Dict[str, Any]:
         """一致性检查阶段"""
         print("  Running consistency checks...")
@@ -582,7 +1183,7 @@ class WriterAgentV2:
             polished_content = self.llm.generate(
                 prompt=polish_prompt,
                 temperature=0.6,
-                system_prompt="你是专业的文学编辑，擅长优化文字流畅度、增强画面感、提升阅读体验。",
+                system_prompt=self._stable_system_prompt(POLISH_SYSTEM_PROMPT),
                 max_tokens=len(fixed_content) + 500  # 允许适度扩展
             )
 
@@ -633,9 +1234,12 @@ class WriterAgentV2:
         
         # 添加章节标题和格式
         final_content = self._format_final_chapter(context, polished_content)
+        # 字数只计算一次，元数据、返回值与后续进度更新共用
+        word_count = len(final_content)
         
-        # 生成章节元数据
+        # 生成章节元数据（FINAL 阶段结果尚未写入上下文，字数在此补上）
         metadata = self._generate_chapter_metadata(context)
+        metadata["word_count"] = word_count
         
         # 保存章节文件
         chapter_file = os.path.join(
@@ -643,15 +1247,26 @@ class WriterAgentV2:
         )
         
         try:
-            with open(chapter_file, "w", encoding="utf-8") as f:
-                f.write(final_content)
+            # 一次编码后整块写入
+            _write_bytes(chapter_file, final_content.encode("utf-8"))
+            self._last_chapter_number = context.chapter_number
+            self._last_chapter_text = final_content
             
             # 保存元数据
             metadata_file = os.path.join(
                 self.chapters_dir, f"chapter-{context.chapter_number:03d}.meta.json"
             )
-            with open(metadata_file, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, ensure_ascii=False, indent=2)
+            _dump_json_file(metadata_file, metadata)
+
+            # 正式章节已保存，草稿自动保存文件不再需要（管道失败时保留以便恢复）
+            draft_file = context.stage_results.get(PipelineStage.DRAFT, {}).get("draft_file")
+            if draft_file:
+                try:
+                    os.remove(draft_file)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f"Failed to remove draft autosave: {e}")
             
             return {
                 "success": True,
@@ -659,7 +1274,7 @@ class WriterAgentV2:
                 "metadata": metadata,
                 "chapter_file": chapter_file,
                 "metadata_file": metadata_file,
-                "word_count": len(final_content)
+                "word_count": word_count
             }
             
         except Exception as e:
@@ -818,7 +1433,7 @@ class WriterAgentV2:
         """构建大纲提示词"""
         chapter_info = context.chapter_info
         
-        prompt = f"""请为小说的第{context.chapter_number}章创建详细大纲。
+        parts = [f"""请为小说的第{context.chapter_number}章创建详细大纲。
 
 ## 章节基本信息
 - 标题: {chapter_info.get('title', f'第{context.chapter_number}章')}
@@ -826,50 +1441,20 @@ class WriterAgentV2:
 - 字数目标: {chapter_info.get('word_count_target', 3000)}字
 
 ## 关键情节点（必须包含）
-"""
+"""]
         
         for point in chapter_info.get("key_plot_points", []):
-            prompt += f"- {point}\n"
+            parts.append(f"- {point}\n")
         
         # 添加RAG检索的上下文
         if rag_context:
-            prompt += "\n## 相关上下文（从前文检索）\n"
+            parts.append("\n## 相关上下文（从前文检索）\n")
             for i, ctx in enumerate(rag_context[:5], 1):
-                prompt += f"{i}. [{ctx['source']} 第{ctx['chapter']}章] {ctx['content']}\n"
+                parts.append(f"{i}. [{ctx['source']} 第{ctx['chapter']}章] {ctx['content']}\n")
         
-        prompt += """
-## 大纲要求
-请输出以下结构的详细大纲：
+        parts.append(OUTLINE_REQUIREMENTS)
 
-### 章节结构
-1. 开篇场景（300-500字）：如何吸引读者？
-2. 发展部分（1500-2000字）：情节如何推进？
-3. 高潮场景（800-1200字）：本章的核心冲突或转折点
-4. 结尾钩子（200-300字）：如何为下一章铺垫？
-
-### 场景安排
-列出3-5个具体场景，每个场景包含：
-- 场景地点
-- 出场人物
-- 核心事件
-- 情绪基调
-
-### 节奏设计
-- 爽点/亮点位置
-- 信息密度控制
-- 情绪曲线变化
-
-请直接输出详细大纲，不要添加额外解释。"""
-
-        # 注入V7约束
-        if self.v7_constraints:
-            prompt += f"""
-
-## 类型约束（必须严格遵守）
-{self.v7_constraints}
-"""
-
-        return prompt
+        return "".join(parts)
 
     def _parse_outline(self, outline_text: str) -> Dict[str, Any]:
         """解析大纲文本为结构化格式"""
@@ -943,7 +1528,7 @@ class WriterAgentV2:
         """构建检查点写作提示词"""
         chapter_info = context.chapter_info
         
-        prompt = f"""请继续创作小说的第{context.chapter_number}章。
+        parts = [f"""请继续创作小说的第{context.chapter_number}章。
 
 ## 当前进度
 - 检查点: {checkpoint['checkpoint_id']} - {checkpoint['target']}
@@ -951,7 +1536,7 @@ class WriterAgentV2:
 - 描述: {checkpoint.get('description', '继续章节写作')}
 
 ## 已完成的章节内容
-{previous_content[-2000:] if previous_content else '[这是章节开头]'}
+{previous_content[-CHECKPOINT_CONTEXT_CHARS:] if previous_content else '[这是章节开头]'}
 
 ## 章节信息
 - 标题: {chapter_info.get('title', f'第{context.chapter_number}章')}
@@ -959,84 +1544,89 @@ class WriterAgentV2:
 - 关键情节点: {', '.join(chapter_info.get('key_plot_points', [])[:3])}
 
 ## 相关上下文
-"""
+"""]
         
         # 添加RAG检索的上下文
         if rag_context:
             for ctx in rag_context[:3]:
-                prompt += f"- [{ctx['source']} 第{ctx['chapter']}章] {ctx['content']}\n"
+                parts.append(f"- [{ctx['source']} 第{ctx['chapter']}章] {ctx['content']}\n")
         else:
-            prompt += "- 暂无特定上下文\n"
+            parts.append("- 暂无特定上下文\n")
         
-        prompt += f"""
-## 写作要求
-1. 自然衔接已写内容
-2. 推进情节发展
-3. 保持角色性格一致
-4. 语言生动，有画面感
-5. 控制节奏，避免信息过载
-
-请直接输出这个检查点的内容，不要总结或解释。"""
-
-        # 注入V7约束
-        if self.v7_constraints:
-            prompt += f"""
-
-## 类型约束（必须严格遵守）
-{self.v7_constraints}
-"""
+        parts.append(CHECKPOINT_REQUIREMENTS)
 
         # Phase 2: 注入WritingConstraintManager的约束提示
         if self.constraint_manager:
             try:
                 constraint_prompt = self.constraint_manager.get_constraint_prompt(context.chapter_number)
-                prompt += f"""
+                parts.append(f"""
 
 ## 写作约束检查清单（严格遵守）
 {constraint_prompt}
-"""
+""")
             except Exception as e:
                 logger.warning(f"Failed to get constraint prompt: {e}")
 
-        return prompt
+        return "".join(parts)
 
     def _build_consistency_context(self, context: PipelineContext) -> Dict[str, Any]:
         """构建一致性检查上下文"""
-        # 加载项目文件
         context_data = {}
-        
+
         files_to_load = [
             ("outline.md", "outline"),
             ("characters.json", "characters"),
             ("world-rules.json", "world_rules"),
             ("chapter-list.json", "chapter_list")
         ]
-        
-        for filename, key in files_to_load:
+
+        def load_file(filename: str) -> Any:
             filepath = os.path.join(self.project_dir, filename)
-            if os.path.exists(filepath):
-                try:
-                    if filename.endswith('.json'):
-                        with open(filepath, "r", encoding="utf-8") as f:
-                            context_data[key] = json.load(f)
-                    else:
-                        with open(filepath, "r", encoding="utf-8") as f:
-                            context_data[key] = f.read()
-                except Exception as e:
-                    logger.warning(f"Failed to load {filename}: {e}")
-        
-        # 添加前一章节内容
-        if context.chapter_number > 1:
+            try:
+                if filename.endswith('.json'):
+                    return self._read_json(filepath)
+                return self._read_text(filepath)
+            except FileNotFoundError:
+                return None
+            except Exception as e:
+                logger.warning(f"Failed to load {filename}: {e}")
+                return None
+
+        # 前一章节结尾：优先取内存中刚写完的章节，其次是进度文件中保存的结尾，
+        # 旧项目回退为只读文件尾部
+        def load_previous_ending() -> Optional[str]:
+            if self._last_chapter_number == context.chapter_number - 1 and self._last_chapter_text:
+                return self._last_chapter_text[-500:]
+
+            progress = self._load_progress_data()
+            if progress:
+                entries = progress.get("chapters", [])
+                index = self._find_chapter_index(entries, context.chapter_number - 1)
+                if index is not None and entries[index].get("ending"):
+                    return entries[index]["ending"]
+
             prev_file = os.path.join(
                 self.chapters_dir, f"chapter-{context.chapter_number - 1:03d}.md"
             )
-            if os.path.exists(prev_file):
-                try:
-                    with open(prev_file, "r", encoding="utf-8") as f:
-                        context_data["previous_chapter"] = f.read()
-                except Exception as e:
-                    logger.warning(f"Failed to load previous chapter: {e}")
-        
+            try:
+                return self._read_tail(prev_file)
+            except FileNotFoundError:
+                return None
+            except Exception as e:
+                logger.warning(f"Failed to load previous chapter: {e}")
+                return None
+
+        # 各文件基本都命中 (mtime, size) 缓存，逐个加载即可，无需线程池
+        for filename, key in files_to_load:
+            value = load_file(filename)
+            if value is not None:
+                context_data[key] = value
+
+        if context.chapter_number > 1:
+            ending = load_previous_ending()
+            if ending is not None:
+                context_data["previous_chapter_ending"] = ending
+
         return context_data
 
     def _fix_critical_issues(self, content: str, issues: List[Dict[str, Any]]) -> str:
@@ -1047,31 +1637,32 @@ class WriterAgentV2:
         print(f"    Attempting to fix {len(issues)} critical issues...")
         
         # 构建修复提示词
-        prompt = f"""请修复以下小说章节内容中的严重一致性错误：
+        parts = [f"""请修复以下小说章节内容中的严重一致性错误：
 
 ## 原始内容
 {content}
 
 ## 需要修复的问题
-"""
+"""]
         
         for i, issue in enumerate(issues[:5], 1):  # 最多修复5个问题
-            prompt += f"{i}. {issue.get('type', 'Consistency')}: {issue.get('message', 'Unknown issue')}\n"
+            parts.append(f"{i}. {issue.get('type', 'Consistency')}: {issue.get('message', 'Unknown issue')}\n")
         
-        prompt += """
+        parts.append("""
 ## 修复要求
 1. 最小化修改，保持故事主线不变
 2. 确保所有设定一致性错误被修复
 3. 保持文字流畅度
 4. 直接输出修复后的完整章节内容
 
-请输出修复后的章节内容："""
+请输出修复后的章节内容：""")
+        prompt = "".join(parts)
         
         try:
             fixed_content = self.llm.generate(
                 prompt=prompt,
                 temperature=0.3,  # 低温度确保最小修改
-                system_prompt="你是专业的设定一致性编辑，擅长最小化修改修复设定错误。",
+                system_prompt=FIX_SYSTEM_PROMPT,
                 max_tokens=len(content) + 500
             )
             return fixed_content.strip()
@@ -1083,7 +1674,7 @@ class WriterAgentV2:
         """构建润色提示词"""
         chapter_info = context.chapter_info
         
-        prompt = f"""请对以下小说章节进行文字润色和优化：
+        parts = [f"""请对以下小说章节进行文字润色和优化：
 
 ## 章节信息
 - 标题: {chapter_info.get('title', f'第{context.chapter_number}章')}
@@ -1093,59 +1684,22 @@ class WriterAgentV2:
 {content}
 
 ## 需要关注的问题
-"""
+"""]
         
         if issues:
             non_critical = [issue for issue in issues if issue.get("severity") != "critical"]
             if non_critical:
-                prompt += "以下一致性问题已标记（非严重）：\n"
+                parts.append("以下一致性问题已标记（非严重）：\n")
                 for issue in non_critical[:3]:
-                    prompt += f"- {issue.get('type')}: {issue.get('message', '')}\n"
+                    parts.append(f"- {issue.get('type')}: {issue.get('message', '')}\n")
             else:
-                prompt += "无标记的非严重问题。\n"
+                parts.append("无标记的非严重问题。\n")
         else:
-            prompt += "无标记的问题。\n"
+            parts.append("无标记的问题。\n")
         
-        prompt += """
-## 润色要求
-请从以下维度优化内容：
-
-### 1. 文字流畅度
-- 调整句式，避免重复
-- 优化段落衔接
-- 改善阅读节奏
-
-### 2. 画面感增强
-- 加强环境描写
-- 细化动作细节
-- 增强五感体验
-
-### 3. 情绪渲染
-- 强化情绪表达
-- 改善对话语气
-- 增强场景氛围
-
-### 4. 信息密度
-- 确保关键信息突出
-- 删除冗余描述
-- 平衡叙述与对话
-
-### 5. 网文特性
-- 确保爽点/亮点突出
-- 保持节奏紧凑
-- 章末留有钩子
+        parts.append(POLISH_REQUIREMENTS)
 
-请直接输出润色后的完整章节内容，不要添加额外解释。"""
-
-        # 注入V7约束
-        if self.v7_constraints:
-            prompt += f"""
-
-## 类型约束（必须严格遵守）
-{self.v7_constraints}
-"""
-
-        return prompt
+        return "".join(parts)
 
     def _calculate_improvement_metrics(self, original: str, polished: str) -> Dict[str, Any]:
         """计算改进指标"""
@@ -1318,83 +1872,120 @@ class WriterAgentV2:
 
     def _update_project_state(self, context: PipelineContext, final_result: Dict[str, Any]):
         """更新项目状态"""
+        # 本次更新的所有时间戳共用一次取值
+        now_iso = datetime.now().isoformat()
+
         # 更新章节列表状态
         chapter_list_file = os.path.join(self.project_dir, "chapter-list.json")
-        if os.path.exists(chapter_list_file):
-            try:
-                with open(chapter_list_file, "r", encoding="utf-8") as f:
-                    chapters = json.load(f)
-
-                for ch in chapters:
-                    if ch.get("chapter_number") == context.chapter_number:
-                        ch["status"] = "completed" if final_result.get("success") else "failed"
-                        ch["completed_at"] = datetime.now().isoformat()
-                        ch["word_count"] = final_result.get("word_count", 0)
-                        break
+        try:
+            chapters = self._read_json(chapter_list_file)
 
-                with open(chapter_list_file, "w", encoding="utf-8") as f:
-                    json.dump(chapters, f, ensure_ascii=False, indent=2)
-            except Exception as e:
-                logger.warning(f"Failed to update chapter list: {e}")
+            entry = {
+                "chapter_number": context.chapter_number,
+                "status": "completed" if final_result.get("success") else "failed",
+                "completed_at": now_iso,
+                "word_count": final_result.get("word_count", 0),
+            }
+            if self._apply_chapter_entry(chapters, entry):
+                self._write_json(chapter_list_file, chapters)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to update chapter list: {e}")
+            self._invalidate_cache(chapter_list_file)
 
         # 更新进度文件
         progress_file = os.path.join(self.project_dir, "novel-progress.txt")
-        if os.path.exists(progress_file):
-            try:
-                with open(progress_file, "r", encoding="utf-8") as f:
-                    progress = json.load(f)
-
-                # 更新章节信息
-                chapter_entry = {
-                    "chapter_number": context.chapter_number,
-                    "title": context.chapter_info.get("title", f"第{context.chapter_number}章"),
-                    "status": "completed" if final_result.get("success") else "failed",
-                    "word_count": final_result.get("word_count", 0),
-                    "completed_at": datetime.now().isoformat(),
-                    "errors": context.errors,
-                    "warnings": context.warnings
-                }
-
-                # 添加到进度
-                if "chapters" not in progress:
-                    progress["chapters"] = []
-
-                # 更新或添加章节条目
-                found = False
-                for i, ch in enumerate(progress["chapters"]):
-                    if ch.get("chapter_number") == context.chapter_number:
-                        progress["chapters"][i] = chapter_entry
-                        found = True
-                        break
-
-                if not found:
-                    progress["chapters"].append(chapter_entry)
+        try:
+            progress = self._read_json(progress_file)
 
-                # 更新统计信息
-                completed_chapters = sum(1 for ch in progress["chapters"] if ch.get("status") == "completed")
-                total_word_count = sum(ch.get("word_count", 0) for ch in progress["chapters"])
+            # 更新章节信息
+            chapter_entry = {
+                "chapter_number": context.chapter_number,
+                "title": context.chapter_info.get("title", f"第{context.chapter_number}章"),
+                "status": "completed" if final_result.get("success") else "failed",
+                "word_count": final_result.get("word_count", 0),
+                "completed_at": now_iso,
+                "errors": context.errors,
+                "warnings": context.warnings
+            }
+            if final_result.get("success"):
+                chapter_entry["quality_score"] = 7.0  # 默认评分
+                # 保存章节结尾，下一章构建上下文时无需再打开本章文件
+                final_content = context.stage_results.get(PipelineStage.FINAL, {}).get("final_content", "")
+                chapter_entry["ending"] = final_content[-500:]
+
+            # 添加到进度
+            if "chapters" not in progress:
+                progress["chapters"] = []
+
+            # 更新或添加章节条目（章节通常按序存放，先直接按下标定位）
+            chapter_entries = progress["chapters"]
+            index = self._find_chapter_index(chapter_entries, context.chapter_number)
+            old_entry = None
+            if index is None:
+                chapter_entries.append(chapter_entry)
+            else:
+                old_entry = chapter_entries[index]
+                chapter_entries[index] = chapter_entry
+
+            # 更新统计信息：只对本章的新旧差值做增量计算
+            if "completed_chapters" in progress and "total_word_count" in progress:
+                completed_chapters = progress["completed_chapters"]
+                total_word_count = progress["total_word_count"]
+                if old_entry:
+                    completed_chapters -= old_entry.get("status") == "completed"
+                    total_word_count -= old_entry.get("word_count", 0)
+                completed_chapters += chapter_entry["status"] == "completed"
+                total_word_count += chapter_entry["word_count"]
+            else:
+                completed_chapters = sum(1 for ch in chapter_entries if ch.get("status") == "completed")
+                total_word_count = sum(ch.get("word_count", 0) for ch in chapter_entries)
 
-                progress["completed_chapters"] = completed_chapters
-                progress["total_word_count"] = total_word_count
-                progress["last_updated"] = datetime.now().isoformat()
+            progress["completed_chapters"] = completed_chapters
+            progress["total_word_count"] = total_word_count
+            progress["last_updated"] = now_iso
 
-                with open(progress_file, "w", encoding="utf-8") as f:
-                    json.dump(progress, f, ensure_ascii=False, indent=2)
-            except Exception as e:
-                logger.warning(f"Failed to update progress file: {e}")
+            # 当前章节与整体状态（原先由 ProgressManager 再读写一遍进度文件）
+            first_pending = self._next_pending_index(
+                progress, len(chapter_entries) - 1 if index is None else index
+            )
+            if first_pending is not None:
+                progress["current_chapter"] = chapter_entries[first_pending].get("chapter_number")
+            if completed_chapters == progress.get("total_chapters"):
+                progress["status"] = "completed"
+            elif completed_chapters > 0:
+                progress["status"] = "writing"
+
+            self._write_json(progress_file, progress)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to update progress file: {e}")
+            self._invalidate_cache(progress_file)
 
-        # Phase 3: 更新 ConsistencyTracker 和 WritingConstraintManager
-        if final_result.get("success"):
-            self._update_trackers(context)
+        if not final_result.get("success"):
+            return
 
         # Phase 1: 开篇诊断 (第1-3章)
-        if final_result.get("success") and context.chapter_number <= 3:
-            print(f"\n{'=' * 60}")
-            print(f"[开篇诊断] 章节 {context.chapter_number} 已完成，启动黄金三章诊断...")
-            print("=" * 60)
+        # 诊断只读取已保存的章节文件，与追踪器更新互不依赖：
+        # 诊断的LLM请求在后台线程发出，同时在当前线程更新追踪器
+        run_diagnosis = context.chapter_number <= 3
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            diagnosis_future = None
+            if run_diagnosis:
+                print(f"\n{'=' * 60}")
+                print(f"[开篇诊断] 章节 {context.chapter_number} 已完成，启动黄金三章诊断...")
+                print("=" * 60)
+                diagnosis_future = executor.submit(self._run_opening_diagnosis, context.chapter_number)
+
+            # Phase 3: 更新 ConsistencyTracker 和 WritingConstraintManager
+            self._update_trackers(context)
 
-            diagnosis_result = self._run_opening_diagnosis(context.chapter_number)
+            if diagnosis_future:
+                diagnosis_result = diagnosis_future.result()
 
+        if run_diagnosis:
             # 如果诊断不通过，触发强制重写
             if not diagnosis_result.get("passed"):
                 grade = diagnosis_result.get("grade", "F")
@@ -1408,17 +1999,54 @@ class WriterAgentV2:
             # 更新进度文件中的开篇诊断结果
             if diagnosis_result.get("grade"):
                 try:
-                    with open(progress_file, "r", encoding="utf-8") as f:
-                        progress = json.load(f)
+                    progress = self._read_json(progress_file)
 
                     for ch in progress.get("chapters", []):
                         if ch.get("chapter_number") == context.chapter_number:
                             ch["opening_diagnosis_grade"] = diagnosis_result.get("grade")
 
-                    with open(progress_file, "w", encoding="utf-8") as f:
-                        json.dump(progress, f, ensure_ascii=False, indent=2)
+                    self._write_json(progress_file, progress)
                 except Exception as e:
                     logger.warning(f"Failed to update diagnosis grade: {e}")
+                    self._invalidate_cache(progress_file)
+
+    def _next_pending_index(self, progress: Dict[str, Any], updated: int) -> Optional[int]:
+        """
+        第一个 pending 章节的下标
+
+        同一进度对象上，第一个 pending 章节只可能因刚更新的第 updated 条而移动，
+        按差值调整即可；进度对象重新加载过则全量扫描一次。
+        """
+        entries = progress["chapters"]
+        hint = self._pending_hint
+        if hint is None or hint[0] is not progress:
+            first = next(
+                (i for i, ch in enumerate(entries) if ch.get("status") == "pending"), None
+            )
+        else:
+            first = hint[1]
+            if entries[updated].get("status") == "pending":
+                if first is None or updated < first:
+                    first = updated
+            elif updated == first:
+                first = next(
+                    (i for i in range(updated + 1, len(entries))
+                     if entries[i].get("status") == "pending"),
+                    None
+                )
+        self._pending_hint = (progress, first)
+        return first
+
+    @staticmethod
+    def _find_chapter_index(entries: List[Dict[str, Any]], chapter_number: int) -> Optional[int]:
+        """查找章节条目下标，优先尝试 chapter_number - 1"""
+        guess = chapter_number - 1
+        if 0 <= guess < len(entries) and entries[guess].get("chapter_number") == chapter_number:
+            return guess
+        for i, ch in enumerate(entries):
+            if ch.get("chapter_number") == chapter_number:
+                return i
+        return None
 
     def _update_trackers(self, context: PipelineContext):
         """更新追踪器状态"""
@@ -1432,14 +2060,20 @@ class WriterAgentV2:
         if not content:
             return
 
-        # 更新 WritingConstraintManager
-        if self.constraint_manager:
+        # 本章的境界、地点、宗门与主角名只检测一次，各追踪器共用
+        detected_realm = detected_location = detected_faction = ""
+        if self.constraint_manager or self.skill_context_bus:
             try:
-                # 尝试检测本章的境界、地点、宗门变化
                 detected_realm = self._detect_realm_from_content(content)
                 detected_location = self._detect_location_from_content(content)
                 detected_faction = self._detect_faction_from_content(content)
+            except Exception as e:
+                logger.warning(f"Failed to detect chapter state: {e}")
+        protagonist = self._get_protagonist_name()
 
+        # 更新 WritingConstraintManager
+        if self.constraint_manager:
+            try:
                 self.constraint_manager.update_constraints_after_chapter(
                     context.chapter_number,
                     content,
@@ -1452,27 +2086,24 @@ class WriterAgentV2:
                 logger.warning(f"Failed to update constraint manager: {e}")
 
         # 更新 ConsistencyTracker
-        if self.consistency_tracker and hasattr(self.consistency_tracker, 'track_character_appearance'):
+        if self.consistency_tracker and hasattr(self.consistency_tracker, 'track_chapter'):
             try:
-                # 追踪角色出现
-                import re
-                name_pattern = re.compile(r"[\u4e00-\u9fa5]{2,4}(?:的|是|在|对|和)")
-                # 简单检测主要角色名出现
-                protagonist = self._get_protagonist_name()
-                if protagonist and protagonist in content:
-                    self.consistency_tracker.track_character_appearance(protagonist, context.chapter_number)
-
-                # 检测境界突破
+                # 追踪角色出现：简单检测主要角色名出现
+                characters = [protagonist] if protagonist and protagonist in content else []
+
+                # 检测境界突破（简单记录，不做详细检测）
                 realm_keywords = ["突破", "晋级", "晋升"]
-                for keyword in realm_keywords:
-                    if keyword in content:
-                        # 简单记录，不做详细检测
-                        self.consistency_tracker.track_timeline_event(
-                            context.chapter_number,
-                            "realm_breakthrough",
-                            f"第{context.chapter_number}章有境界突破"
-                        )
-                        break
+                events = []
+                if any(keyword in content for keyword in realm_keywords):
+                    events.append(
+                        ("realm_breakthrough", f"第{context.chapter_number}章有境界突破")
+                    )
+
+                # 本章的全部追踪更新合并为一次读改写
+                if characters or events:
+                    self.consistency_tracker.track_chapter(
+                        context.chapter_number, characters, events
+                    )
             except Exception as e:
                 logger.warning(f"Failed to update consistency tracker: {e}")
 
@@ -1483,17 +2114,14 @@ class WriterAgentV2:
                 context_data = {}
 
                 # 境界信息
-                detected_realm = self._detect_realm_from_content(content)
                 if detected_realm:
                     context_data["current_realm"] = detected_realm
 
                 # 地点信息
-                detected_location = self._detect_location_from_content(content)
                 if detected_location:
                     context_data["current_location"] = detected_location
 
                 # 势力信息
-                detected_faction = self._detect_faction_from_content(content)
                 if detected_faction:
                     context_data["current_faction"] = detected_faction
 
@@ -1502,7 +2130,6 @@ class WriterAgentV2:
                 context_data["payoff_density"] = payoff_result.get("density", 0)
 
                 # 主角名
-                protagonist = self._get_protagonist_name()
                 if protagonist:
                     context_data["protagonist"] = protagonist
 
@@ -1518,8 +2145,6 @@ class WriterAgentV2:
 
     def _detect_realm_from_content(self, content: str) -> str:
         """从内容中检测境界 - 改进版，精确匹配已知境界"""
-        import re
-
         # 获取已知的境界列表
         known_realms = []
         if self.constraint_manager:
@@ -1533,55 +2158,38 @@ class WriterAgentV2:
                           "剑心境", "剑心境一层", "剑心境二层",
                           "剑意境", "剑意境一层"]
 
-        # 构建精确匹配的模式（使用词边界）
-        # 匹配 "突破到XXX" 或 "已达XXX" 或 "XXX层/期/境"
-        realm_mentions = []
-
-        for realm in known_realms:
-            # 模式1: 突破到XXX
-            pattern1 = rf"(?:突破|晋升|晋级|达到|升至|踏入|进入)(?:到|了)?{realm}"
-            if re.search(pattern1, content):
-                realm_mentions.append(realm)
+        # 匹配 "突破到XXX" 或 "XXX层/期/境"，各自只扫描正文一遍
+        # 模式1: 突破到XXX —— 收集动词（及可选的"到/了"）之后的起始位置
+        starts = set()
+        for m in _REALM_VERB_RE.finditer(content):
+            pos = m.start() + 2
+            starts.add(pos)
+            if content[pos:pos + 1] in ("到", "了"):
+                starts.add(pos + 1)
 
-            # 模式2: XXX层/期/境（直接境界名）
-            if realm.endswith(("层", "期", "境")):
-                # 直接境界名匹配，前后有边界
-                pattern2 = rf"(?<![a-zA-Z\u4e00-\u9fa5]){realm}(?![a-zA-Z\u4e00-\u9fa5])"
-                if re.search(pattern2, content):
-                    realm_mentions.append(realm)
+        # 模式2: XXX层/期/境（直接境界名，前后有边界）
+        suffixed = tuple(r for r in known_realms if r.endswith(("层", "期", "境")))
+        named = set(_realm_name_pattern(suffixed).findall(content)) if suffixed else set()
 
-        if realm_mentions:
-            # 返回最后一个提及的境界（通常是当前境界）
-            return realm_mentions[-1]
+        # 按已知境界顺序取最后一个被提及的境界（通常是当前境界）
+        for realm in reversed(known_realms):
+            if realm in named or any(content.startswith(realm, pos) for pos in starts):
+                return realm
 
         return ""
 
     def _detect_location_from_content(self, content: str) -> str:
         """从内容中检测地点"""
-        import re
-        # 常见地点关键词
-        location_patterns = [
-            r"在([\u4e00-\u9fa5]+)",
-            r"来到([\u4e00-\u9fa5]+)",
-            r"前往([\u4e00-\u9fa5]+)",
-        ]
-        for pattern in location_patterns:
-            matches = re.findall(pattern, content)
+        for pattern in _LOCATION_PATTERNS:
+            matches = pattern.findall(content)
             if matches:
                 return matches[-1]
         return ""
 
     def _detect_faction_from_content(self, content: str) -> str:
         """从内容中检测宗门"""
-        import re
-        # 宗门名称模式
-        faction_patterns = [
-            r"加入([\u4e00-\u9fa5]+)",
-            r"进入([\u4e00-\u9fa5]+)",
-            r"拜入([\u4e00-\u9fa5]+)",
-        ]
-        for pattern in faction_patterns:
-            matches = re.findall(pattern, content)
+        for pattern in _FACTION_PATTERNS:
+            matches = pattern.findall(content)
             if matches:
                 return matches[-1]
         return ""
@@ -1597,21 +2205,19 @@ class WriterAgentV2:
 
         # 从 characters.json 加载
         char_file = os.path.join(self.project_dir, "characters.json")
-        if os.path.exists(char_file):
-            try:
-                with open(char_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        for char in data:
-                            if char.get("role") == "protagonist":
-                                return char.get("name", "主角")
-                    elif isinstance(data, dict):
-                        chars = data.get("characters", [])
-                        for char in chars:
-                            if char.get("role") == "protagonist":
-                                return char.get("name", "主角")
-            except:
-                pass
+        try:
+            data = self._read_json(char_file)
+            if isinstance(data, list):
+                for char in data:
+                    if char.get("role") == "protagonist":
+                        return char.get("name", "主角")
+            elif isinstance(data, dict):
+                chars = data.get("characters", [])
+                for char in chars:
+                    if char.get("role") == "protagonist":
+                        return char.get("name", "主角")
+        except:
+            pass
         return "主角"
 
     # ==================== Phase 1: 开篇诊断 ====================
@@ -1635,10 +2241,15 @@ class WriterAgentV2:
             # 加载前三章内容
             chapters_content = {}
             for i in range(1, 4):
+                if i == self._last_chapter_number and self._last_chapter_text:
+                    chapters_content[i] = self._last_chapter_text
+                    continue
                 ch_file = os.path.join(self.chapters_dir, f"chapter-{i:03d}.md")
-                if os.path.exists(ch_file):
+                try:
                     with open(ch_file, "r", encoding="utf-8") as f:
                         chapters_content[i] = f.read()
+                except FileNotFoundError:
+                    pass
 
             if len(chapters_content) < chapter_number:
                 print(f"[警告] 无法加载第{chapter_number}章，跳过开篇诊断")
@@ -1647,10 +2258,10 @@ class WriterAgentV2:
             # 加载项目配置获取类型
             genre = "unknown"
             config_file = os.path.join(self.project_dir, "project-config.json")
-            if os.path.exists(config_file):
-                with open(config_file, "r", encoding="utf-8") as f:
-                    config = json.load(f)
-                    genre = config.get("genre", "unknown")
+            try:
+                genre = self._read_json(config_file).get("genre", "unknown")
+            except FileNotFoundError:
+                pass
 
             protagonist = self._get_protagonist_name()
 
@@ -1659,13 +2270,19 @@ class WriterAgentV2:
                 chapters_content, genre, protagonist
             )
 
-            # 调用 LLM 进行诊断
-            diagnosis_result = self.llm.generate(
-                prompt=diagnosis_prompt,
-                temperature=0.3,
-                system_prompt="你是起点中文网金牌审稿编辑，拥有10年+网文审稿经验。请严格按照开篇诊断标准进行评分。",
-                max_tokens=2000
-            )
+            # 调用 LLM 进行诊断（前三章内容未变时复用上次结果）
+            prompt_key = hashlib.blake2b(
+                diagnosis_prompt.encode("utf-8"), digest_size=16
+            ).hexdigest()
+            diagnosis_result = self._diagnosis_cache.get(prompt_key)
+            if diagnosis_result is None:
+                diagnosis_result = self.llm.generate(
+                    prompt=diagnosis_prompt,
+                    temperature=0.3,
+                    system_prompt="你是起点中文网金牌审稿编辑，拥有10年+网文审稿经验。请严格按照开篇诊断标准进行评分。",
+                    max_tokens=2000
+                )
+                self._diagnosis_cache[prompt_key] = diagnosis_result
 
             # 解析诊断结果
             grade = self._parse_diagnosis_grade(diagnosis_result)
@@ -1763,14 +2380,13 @@ class WriterAgentV2:
 
     def _parse_diagnosis_grade(self, diagnosis_result: str) -> str:
         """从诊断结果中解析综合评级"""
-        import re
         # 查找综合评级
-        match = re.search(r'综合评级[：:]\s*([SABCDF])', diagnosis_result)
+        match = _DIAGNOSIS_GRADE_RE.search(diagnosis_result)
         if match:
             return match.group(1)
 
         # 备选：查找任何 S/A/B/C/D/F 评级
-        match = re.search(r'\n([SABCDF])级', diagnosis_result)
+        match = _DIAGNOSIS_GRADE_FALLBACK_RE.search(diagnosis_result)
         if match:
             return match.group(1)
 
@@ -1782,18 +2398,6 @@ class WriterAgentV2:
         print(f"[强制重写] 第{chapter_number}章开篇诊断不通过，触发重写")
         print("=" * 60)
 
-        # 构建重写提示
-        rewrite_prompt = f"""请重写小说第{chapter_number}章，重点改进以下方面：
-
-1. 确保前三章整体质量达标
-2. 强化钩子设置
-3. 避免毒点
-4. 明确金手指
-5. 增加冲突爆发
-6. 控制信息密度
-
-请保持原有剧情主线，只进行优化改进。"""
-
         # 重新调用写作管道
         try:
             result = self.write_chapter(chapter_number)
@@ -1828,8 +2432,15 @@ class WriterAgentV2:
         payoff_count = 0
         details = []
 
+        # 所有关键词合并为一次扫描，不再逐个遍历正文
+        pattern = _keyword_count_pattern(tuple(self.payoff_keywords))
+        if pattern is not None:
+            counts = Counter(m.group(1) for m in pattern.finditer(content))
+        else:
+            counts = None
+
         for keyword in self.payoff_keywords:
-            count = content.count(keyword)
+            count = counts[keyword] if counts is not None else content.count(keyword)
             if count > 0:
                 payoff_count += count
                 details.append(f"{keyword}: {count}次")
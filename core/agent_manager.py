@@ -60,6 +60,8 @@ class AgentManager:
         self.agent_outputs = {}  # 记录每个 agent 的输出
         self.skills_metadata: Dict[str, SkillMetadata] = {}  # Skill 元数据缓存
         self._trigger_index: Dict[str, str] = {}  # 触发词 -> skill 映射
+        # 技能目录 -> (目录及其子目录的 mtime_ns, SKILL.md 列表, {目录名: SKILL.md})
+        self._skill_file_index: Dict[Path, Tuple[Tuple[int, ...], List[Path], Dict[str, Path]]] = {}
 
         # 初始化时加载所有 skills 元数据
         self._load_all_skills_metadata()
@@ -185,6 +187,24 @@ class AgentManager:
                 return f.read()
         return ""
 
+    @staticmethod
+    def _skill_dir_signature(base_dir: Path) -> Optional[Tuple[int, ...]]:
+        """
+        技能目录及其直接子目录的 mtime_ns，目录不存在时返回 None
+
+        内置技能位于 skills/<分类>/<技能名>/SKILL.md，在分类下新增或重命名技能
+        只会改变分类目录的 mtime，因此子目录也要计入。
+        """
+        try:
+            mtimes = [base_dir.stat().st_mtime_ns]
+            with os.scandir(base_dir) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        mtimes.append(entry.stat().st_mtime_ns)
+        except FileNotFoundError:
+            return None
+        return tuple(mtimes)
+
     def _find_skill_file(self, skill_name: str, base_dir: Path) -> Optional[Path]:
         """
         递归搜索技能文件，支持子目录结构
@@ -196,16 +216,30 @@ class AgentManager:
         Returns:
             技能文件路径，如果不存在则返回None
         """
-        if not base_dir.exists():
+        dir_mtime = self._skill_dir_signature(base_dir)
+        if dir_mtime is None:
             return None
 
-        # 使用 rglob 递归搜索
-        for file_path in base_dir.rglob("SKILL.md"):
-            # 检查目录名是否匹配技能名
-            if file_path.parent.name == skill_name or file_path.stem == skill_name:
-                return file_path
-
-        return None
+        # 递归搜索结果按目录 mtime 缓存为 {目录名: 首个 SKILL.md}，避免每次加载技能都遍历整棵目录树
+        cached = self._skill_file_index.get(base_dir)
+        if cached is None or cached[0] != dir_mtime:
+            files = list(base_dir.rglob("SKILL.md"))
+            by_dir_name: Dict[str, Path] = {}
+            for file_path in files:
+                by_dir_name.setdefault(file_path.parent.name, file_path)
+            cached = (dir_mtime, files, by_dir_name)
+            self._skill_file_index[base_dir] = cached
+
+        _, files, by_dir_name = cached
+        # 检查目录名是否匹配技能名（文件名固定为 SKILL.md，stem 匹配仅在技能名为 "SKILL" 时成立）
+        file_path = by_dir_name.get(skill_name)
+        if file_path is None and skill_name == "SKILL" and files:
+            file_path = files[0]
+        if file_path is not None and not file_path.exists():
+            # 缓存的文件已被删除，丢弃索引后重新搜索
+            del self._skill_file_index[base_dir]
+            return self._find_skill_file(skill_name, base_dir)
+        return file_path
 
     def load_skill_prompt(self, skill_name: str) -> str:
         """加载技能提示词 - 从 skills 目录递归搜索（支持子目录）"""
@@ -235,21 +269,21 @@ class AgentManager:
 
         # 优先从 skills/ 目录读取
         if self.skills_dir.exists():
-            for skill_dir in self.skills_dir.iterdir():
-                if skill_dir.is_dir():
-                    skill_file = skill_dir / "SKILL.md"
-                    if skill_file.exists():
-                        metadata = self.skills_metadata.get(skill_dir.name)
-                        agents.append(
-                            {
-                                "name": skill_dir.name,
-                                "file": "SKILL.md",
-                                "description": metadata.description if metadata else "",
-                                "type": "skill",
-                                "level": metadata.level if metadata else "expert",
-                                "triggers": metadata.triggers if metadata else [],
-                            }
-                        )
+            with os.scandir(self.skills_dir) as it:
+                skill_entries = [entry for entry in it if entry.is_dir()]
+            for skill_dir in skill_entries:
+                if os.path.exists(os.path.join(skill_dir.path, "SKILL.md")):
+                    metadata = self.skills_metadata.get(skill_dir.name)
+                    agents.append(
+                        {
+                            "name": skill_dir.name,
+                            "file": "SKILL.md",
+                            "description": metadata.description if metadata else "",
+                            "type": "skill",
+                            "level": metadata.level if metadata else "expert",
+                            "triggers": metadata.triggers if metadata else [],
+                        }
+                    )
 
         return agents
 
@@ -5,7 +5,10 @@
 
 import os
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+# .env 解析结果缓存：路径 -> ((mtime_ns, size), 配置)，文件未变化时不再重复读盘解析
+_env_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, str]]] = {}
 
 
 def load_env_file(env_path: Optional[str] = None) -> Dict[str, str]:
@@ -37,6 +40,18 @@ def load_env_file(env_path: Optional[str] = None) -> Dict[str, str]:
             print(f"[WARN]️  未找到 {env_path}，请复制 .env.example 为 .env 并配置API密钥")
         return config
 
+    # 文件未变化时直接复用上次解析结果（仍同步到环境变量）
+    cache_key = str(env_path)
+    try:
+        st = env_path.stat()
+        signature = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        signature = None
+    cached = _env_cache.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        os.environ.update(cached[1])
+        return dict(cached[1])
+
     # 读取.env文件
     try:
         with open(env_path, "r", encoding="utf-8") as f:
@@ -63,6 +78,8 @@ def load_env_file(env_path: Optional[str] = None) -> Dict[str, str]:
                     os.environ[key] = value
 
         print(f"[OK] 已加载配置文件: {env_path}")
+        if signature is not None:
+            _env_cache[cache_key] = (signature, dict(config))
 
     except Exception as e:
         print(f"[FAIL] 加载配置文件失败: {e}")
@@ -138,6 +155,23 @@ def save_api_key(key_name: str, key_value: str, env_path: Optional[str] = None)
     Returns:
         是否保存成功
     """
+    return save_api_keys({key_name: key_value}, env_path)
+
+
+def save_api_keys(updates: Dict[str, str], env_path: Optional[str] = None) -> bool:
+    """
+    批量保存多个配置项到.env文件（只读写一次文件）
+
+    Args:
+        updates: {配置名: 配置值}
+        env_path: .env文件路径
+
+    Returns:
+        是否保存成功
+    """
+    if not updates:
+        return True
+
     try:
         # 确定.env文件路径
         if env_path is None:
@@ -159,10 +193,11 @@ def save_api_key(key_name: str, key_value: str, env_path: Optional[str] = None)
                         config[k.strip()] = v.strip()
 
         # 更新密钥
-        config[key_name] = key_value
+        config.update(updates)
 
-        # 写回文件
-        with open(env_path, "w", encoding="utf-8") as f:
+        # 写入临时文件后替换，避免中途失败留下不完整的.env
+        tmp_path = env_path.with_name(env_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
             # 写入注释
             f.write("# AI小说生成器配置文件\n")
             f.write("# 此文件包含敏感的API密钥，请勿提交到Git仓库\n\n")
@@ -207,10 +242,13 @@ def save_api_key(key_name: str, key_value: str, env_path: Optional[str] = None)
                         f.write(f"{key}={config[key]}\n")
                 f.write("\n")
 
-        # 同时更新环境变量
-        os.environ[key_name] = key_value
+        os.replace(tmp_path, env_path)
+
+        # 同时更新环境变量，并使该文件的解析缓存失效
+        os.environ.update(updates)
+        _env_cache.pop(str(env_path), None)
 
-        print(f"[OK] 已保存 {key_name} 到 {env_path}")
+        print(f"[OK] 已保存 {', '.join(updates)} 到 {env_path}")
         return True
 
     except Exception as e:
@@ -5,7 +5,7 @@
 
 import os
 import json
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, List, Any, Optional, Set, Tuple
 from pathlib import Path
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -299,6 +299,9 @@ class ConsistencyTracker:
         self.temporal_state: TemporalState = TemporalState()  # 时间线追踪
         self.item_states: Dict[str, ItemState] = {}  # 物品追踪
 
+        # 主角名缓存: ((mtime_ns, size), 主角名)，characters.json 未变化时不再重新遍历
+        self._protagonist_cache: Optional[Tuple[Tuple[int, int], str]] = None
+
         # 加载已有数据
         self._load()
 
@@ -361,14 +364,43 @@ class ConsistencyTracker:
         }
 
         os.makedirs(os.path.dirname(self.tracker_file), exist_ok=True)
-        with open(self.tracker_file, "w", encoding="utf-8") as f:
+        # 先写临时文件再替换，避免写到一半中断损坏追踪数据
+        tmp_file = self.tracker_file + ".tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, self.tracker_file)
 
-    def track_character_appearance(self, name: str, chapter: int):
-        """追踪角色出现"""
+    def _record_appearance(self, name: str, chapter: int):
+        """记录角色出现（不保存）"""
         if name not in self.characters:
             self.characters[name] = CharacterState(name=name, first_appearance=chapter)
         self.characters[name].last_appearance = chapter
+
+    def track_character_appearance(self, name: str, chapter: int):
+        """追踪角色出现"""
+        self._record_appearance(name, chapter)
+        self._save()
+
+    def track_chapter(
+        self,
+        chapter: int,
+        characters: Optional[List[str]] = None,
+        timeline_events: Optional[List[Tuple[str, str]]] = None,
+    ):
+        """
+        一次记录本章的角色出现与时间线事件，最后只保存一次
+
+        Args:
+            chapter: 章节号
+            characters: 本章出现的角色名
+            timeline_events: (event_type, description) 列表
+        """
+        for name in characters or []:
+            self._record_appearance(name, chapter)
+        for event_type, description in timeline_events or []:
+            self.timeline.append(
+                TimelineEvent(chapter=chapter, event_type=event_type, description=description)
+            )
         self._save()
 
     def track_ability_gain(
@@ -939,16 +971,28 @@ class ConsistencyTracker:
         """获取主角名称"""
         # 从 characters.json 加载
         char_file = os.path.join(self.project_dir, "characters.json")
-        if os.path.exists(char_file):
-            try:
-                with open(char_file, "r", encoding="utf-8") as f:
-                    characters = json.load(f)
-                    for char in characters:
-                        if char.get("role") == "protagonist":
-                            return char.get("name", "主角")
-            except:
-                pass
-        return "主角"
+        try:
+            st = os.stat(char_file)
+        except OSError:
+            return "主角"
+
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._protagonist_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        name = "主角"
+        try:
+            with open(char_file, "r", encoding="utf-8") as f:
+                characters = json.load(f)
+                for char in characters:
+                    if char.get("role") == "protagonist":
+                        name = char.get("name", "主角")
+                        break
+        except:
+            pass
+        self._protagonist_cache = (key, name)
+        return name
 
     def get_context_for_chapter(self, chapter: int) -> str:
         """
@@ -0,0 +1,29 @@
+"""
+JSON 读写工具
+orjson 可用时直接解析/序列化字节，否则回退到标准库 json
+"""
+
+import json
+from typing import Any
+
+# orjson 可选，章节列表、进度等随章节数增长的文件解析/序列化更快
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_loads(raw: bytes) -> Any:
+    """解析 JSON 字节串，优先使用 orjson"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def json_dumps(obj: Any) -> bytes:
+    """序列化为2空格缩进、不转义中文的 UTF-8 JSON，优先使用 orjson"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
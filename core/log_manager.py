@@ -9,6 +9,10 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 import sys
+from collections import deque
+
+# 读取日志文件时的缓冲区大小
+LOG_READ_BUFFER_SIZE = 8192
 
 
 class LogManager:
@@ -28,6 +32,8 @@ class LogManager:
         # 创建日志文件路径
         current_date = datetime.now().strftime("%Y-%m-%d")
         self.log_file = self.log_dir / f"novel_generator_{current_date}.log"
+        # get_recent_logs 结果缓存：((mtime_ns, size, 行数), 内容)
+        self._recent_logs_cache = None
 
         # 配置日志记录器
         self.logger = logging.getLogger("NovelGenerator")
@@ -176,13 +182,22 @@ class LogManager:
 
     def get_recent_logs(self, lines: int = 100) -> str:
         """获取最近的日志内容"""
-        if not self.log_file.exists():
+        try:
+            st = self.log_file.stat()
+        except FileNotFoundError:
             return "暂无日志"
 
+        # 日志文件未变化时直接返回上次结果
+        cache_key = (st.st_mtime_ns, st.st_size, lines)
+        if self._recent_logs_cache and self._recent_logs_cache[0] == cache_key:
+            return self._recent_logs_cache[1]
+
         try:
-            with open(self.log_file, "r", encoding="utf-8") as f:
-                all_lines = f.readlines()
-                return "".join(all_lines[-lines:])
+            # 逐行流式读取，只保留末尾 lines 行，避免把整个日志文件读入内存
+            with open(self.log_file, "r", encoding="utf-8", buffering=LOG_READ_BUFFER_SIZE) as f:
+                recent = "".join(deque(f, maxlen=lines or None))
+            self._recent_logs_cache = (cache_key, recent)
+            return recent
         except Exception as e:
             return f"读取日志失败: {e}"
 
@@ -10,10 +10,10 @@ from enum import Enum
 
 import httpx
 
-try:
-    from config_manager import get_api_key
-except ImportError:
+if __package__:
     from .config_manager import get_api_key
+else:
+    from config_manager import get_api_key
 
 
 def _build_http_client(headers: Optional[Dict[str, str]] = None) -> httpx.Client:
@@ -71,6 +71,14 @@ def _split_system_messages(
     return clean, merged
 
 
+def _cached_system(system_prompt: Optional[str]):
+    """把系统提示词包装为带 cache_control 的文本块，启用 Anthropic 提示词缓存。
+    写作各阶段的系统提示词跨章节保持不变，后续请求可命中缓存的前缀。"""
+    if not system_prompt:
+        return ""
+    return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+
+
 class ModelManager:
     """模型管理器 - 统一调用多种AI模型"""
 
@@ -254,11 +262,7 @@ class ModelManager:
             self.config = self.AVAILABLE_MODELS[model_id]
         else:
             # 尝试通过模型名称查找
-            found_config = None
-            for config in self.AVAILABLE_MODELS.values():
-                if config.name == model_id:
-                    found_config = config
-                    break
+            found_config = _CONFIG_BY_MODEL_NAME.get(model_id)
 
             if found_config:
                 self.config = found_config
@@ -269,27 +273,14 @@ class ModelManager:
     @classmethod
     def get_available_models(cls) -> List[Dict[str, str]]:
         """获取所有可用模型的列表"""
-        return [
-            {
-                "id": model_id,
-                "name": config.display_name,
-                "description": config.description,
-                "provider": config.provider.value,
-            }
-            for model_id, config in cls.AVAILABLE_MODELS.items()
-        ]
+        return [dict(model) for model in _MODEL_LIST]
 
     @classmethod
     def get_models_by_provider(cls, provider: str) -> List[Dict[str, str]]:
         """按提供商获取模型列表"""
         return [
-            {
-                "id": model_id,
-                "name": config.display_name,
-                "description": config.description,
-            }
-            for model_id, config in cls.AVAILABLE_MODELS.items()
-            if config.provider.value == provider
+            {"id": model["id"], "name": model["name"], "description": model["description"]}
+            for model in _MODELS_BY_PROVIDER.get(provider, ())
         ]
 
     def get_api_key(self) -> Optional[str]:
@@ -404,7 +395,7 @@ class ModelManager:
                 max_tokens=self.config.max_tokens,
                 temperature=temperature,
                 messages=api_messages,
-                system=merged_system,
+                system=_cached_system(merged_system),
             ) as stream:
                 for text in stream.text_stream:
                     yield text
@@ -516,7 +507,7 @@ class ModelManager:
                 max_tokens=self.config.max_tokens,
                 temperature=temperature,
                 messages=clean_msgs,
-                system=merged_system,
+                system=_cached_system(merged_system),
             )
 
             return response.content[0].text
@@ -579,7 +570,7 @@ class ModelManager:
                 max_tokens=self.config.max_tokens,
                 temperature=temperature,
                 messages=messages,
-                system=system_prompt if system_prompt else "",
+                system=_cached_system(system_prompt),
             )
 
             return response.content[0].text
@@ -927,9 +918,43 @@ class ModelManager:
             return f"[错误] {self.config.display_name} API调用失败: {str(e)}"
 
 
+# 预定义模型是静态的，导入时一次性建立索引，避免每次查询都遍历 AVAILABLE_MODELS
+_MODEL_LIST = tuple(
+    {
+        "id": model_id,
+        "name": config.display_name,
+        "description": config.description,
+        "provider": config.provider.value,
+    }
+    for model_id, config in ModelManager.AVAILABLE_MODELS.items()
+)
+_MODELS_BY_PROVIDER: Dict[str, tuple] = {}
+for _model in _MODEL_LIST:
+    _MODELS_BY_PROVIDER[_model["provider"]] = _MODELS_BY_PROVIDER.get(_model["provider"], ()) + (_model,)
+_CONFIG_BY_MODEL_NAME: Dict[str, ModelConfig] = {}
+for _config in ModelManager.AVAILABLE_MODELS.values():
+    _CONFIG_BY_MODEL_NAME.setdefault(_config.name, _config)
+del _model, _config
+
+
 # 便捷的工厂函数
 def create_model_manager(
     model_id: str = None, custom_config: Optional[Dict] = None
 ) -> ModelManager:
     """创建模型管理器实例（model_id 为 None 时自动读取 DEFAULT_MODEL_ID 环境变量）"""
     return ModelManager(model_id, custom_config)
+
+
+# 预定义模型的共享实例（ModelManager 只持有配置，每次调用才创建 HTTP 客户端，
+# 因此可在界面与各后台线程之间安全复用，无需加锁）
+_shared_managers: Dict[str, ModelManager] = {}
+
+
+def get_model_manager(model_id: str = None) -> ModelManager:
+    """获取预定义模型的共享 ModelManager 实例，避免界面操作时重复构造"""
+    if model_id is None:
+        model_id = os.environ.get("DEFAULT_MODEL_ID", "claude-3-5-sonnet")
+    manager = _shared_managers.get(model_id)
+    if manager is None:
+        manager = _shared_managers[model_id] = ModelManager(model_id)
+    return manager
@@ -18,30 +18,23 @@ import time
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
-# 导入模型管理器
-try:
-    from model_manager import ModelManager, create_model_manager
-    from config_manager import load_env_file, get_api_key
-except ImportError:
+# 导入模型管理器与各个组件
+# 作为 core 包导入时直接使用相对导入；以脚本方式运行时才用顶层模块名，
+# 避免每次冷启动先触发一次失败的顶层导入
+if __package__:
     from .model_manager import ModelManager, create_model_manager
     from .config_manager import load_env_file, get_api_key
-
-# 导入各个组件
-try:
-    from progress_manager import ProgressManager
-    from chapter_manager import ChapterManager
-    from character_manager import CharacterManager
-except ImportError:
     from .progress_manager import ProgressManager
     from .chapter_manager import ChapterManager
     from .character_manager import CharacterManager
-
-# 导入V7系统
-try:
-    from v7_integrator import V7Integrator
-except ImportError:
     from .v7_integrator import V7Integrator
-
+else:
+    from model_manager import ModelManager, create_model_manager
+    from config_manager import load_env_file, get_api_key
+    from progress_manager import ProgressManager
+    from chapter_manager import ChapterManager
+    from character_manager import CharacterManager
+    from v7_integrator import V7Integrator
 
 class NovelGenerator:
     """
@@ -439,11 +432,17 @@ class NovelGenerator:
         print(f"[审查] 一致性检查点: 第{completed}章完成")
         print("=" * 60)
 
+        # 质量门在本章写作时已对同一窗口做过检查（含LLM语义链），直接复用结果
+        check_result = None
+        if getattr(self, "quality_gate", None):
+            check_result = self.quality_gate.pop_window_result(completed)
+
         # 使用滑动窗口检查（更高效）
-        check_result = self.consistency_checker.check_recent_n_chapters(
-            n=5,
-            before_chapter=completed
-        )
+        if check_result is None:
+            check_result = self.consistency_checker.check_recent_n_chapters(
+                n=5,
+                before_chapter=completed
+            )
 
         critical_issues = [v for v in check_result.get("violations", [])
                           if v.get("severity") == "critical"]
@@ -659,10 +658,13 @@ class NovelGenerator:
 
         # 加载 senior-editor skill
         try:
-            from core.agent_manager import AgentManager
+            # 复用已有的 agent manager（构造时会扫描并解析全部 skill 元数据），
+            # 没有时才创建一次并保存，供后续每5章的审核继续使用
+            agent_mgr = getattr(self, "agent_manager", None)
+            if agent_mgr is None:
+                from core.agent_manager import AgentManager
 
-            # 创建 agent manager 来加载 skill
-            agent_mgr = AgentManager(self.llm_client, self.project_dir)
+                agent_mgr = self.agent_manager = AgentManager(self.llm_client, self.project_dir)
 
             # 加载 senior-editor skill
             skill_prompt = agent_mgr.load_skill_prompt("senior-editor")
@@ -17,7 +17,7 @@ import json
 import time
 import logging
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from datetime import datetime
 from enum import Enum
 
@@ -77,6 +77,9 @@ class Orchestrator:
         # 检查点
         self.checkpoint_interval = config.get("checkpoint_interval", 5)
 
+        # 最近一次流式写入 .partial 文件的章节 (章节号, 完整文本)，保存时内容一致则直接改名
+        self._streamed_chapter: Optional[Tuple[int, str]] = None
+
         # 回调
         self.on_chapter_complete: Optional[Callable] = None
         self.on_error: Optional[Callable] = None
@@ -463,9 +466,16 @@ class Orchestrator:
         chapters_dir = self.project_dir / "chapters"
         chapters_dir.mkdir(parents=True, exist_ok=True)
 
-        # 保存为Markdown文件
+        # 保存为Markdown文件（流式写作时已边收边写入 .partial，内容未变则直接改名）
         md_file = chapters_dir / f"chapter_{chapter_num:03d}.md"
-        md_file.write_text(content, encoding="utf-8")
+        partial_file = md_file.with_name(md_file.name + ".partial")
+        streamed, self._streamed_chapter = self._streamed_chapter, None
+        if streamed == (chapter_num, content) and partial_file.exists():
+            os.replace(partial_file, md_file)
+        else:
+            md_file.write_text(content, encoding="utf-8")
+            if partial_file.exists():
+                partial_file.unlink()
         logger.info(f"Chapter {chapter_num} saved as Markdown: {md_file}")
 
         # 同时保存元数据JSON（用于情绪追踪）
@@ -582,23 +592,15 @@ class Orchestrator:
 
         # 使用流式写作
         full_content = ""
+        content_parts: List[str] = []
         result = None
 
         try:
             # 获取流式生成器
             stream_gen = self.emotion_writer.write_chapter_stream(context, previous_chapter)
 
-            # 迭代流式响应
-            for chunk_text, chunk_result in stream_gen:
-                if chunk_result is not None:
-                    # 收到最终结果
-                    result = chunk_result
-                elif chunk_text:
-                    # 收到文本块
-                    full_content += chunk_text
-                    # 触发流式文本回调
-                    if self.on_text_stream:
-                        self.on_text_stream(chunk_text)
+            # 迭代流式响应（文本块边收边写入 .partial 文件）
+            full_content, result = self._consume_stream(chapter_num, stream_gen, content_parts)
 
             # 如果没有收到最终结果（兼容模式），构造一个
             if result is None:
@@ -616,7 +618,7 @@ class Orchestrator:
                 "success": False,
                 "chapter": chapter_num,
                 "error": str(e),
-                "content": full_content
+                "content": "".join(content_parts)
             }
 
         # 更新情绪追踪状态
@@ -644,6 +646,36 @@ class Orchestrator:
                 "error": result.get("error", "Unknown error")
             }
 
+    def _consume_stream(self, chapter_num: int, stream_gen,
+                        content_parts: List[str]) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        迭代流式生成器：文本块追加到 content_parts 并写入 chapter_XXX.md.partial
+
+        文件按默认缓冲区批量写出，不逐块落盘。
+        返回 (完整文本, 生成器给出的最终结果或 None)；中途异常时已收到的文本留在 content_parts。
+        """
+        chapters_dir = self.project_dir / "chapters"
+        chapters_dir.mkdir(parents=True, exist_ok=True)
+        partial_file = chapters_dir / f"chapter_{chapter_num:03d}.md.partial"
+
+        result = None
+        with open(partial_file, "w", encoding="utf-8") as out:
+            for chunk_text, chunk_result in stream_gen:
+                if chunk_result is not None:
+                    # 收到最终结果
+                    result = chunk_result
+                elif chunk_text:
+                    # 收到文本块
+                    content_parts.append(chunk_text)
+                    out.write(chunk_text)
+                    # 触发流式文本回调
+                    if self.on_text_stream:
+                        self.on_text_stream(chunk_text)
+
+        full_content = "".join(content_parts)
+        self._streamed_chapter = (chapter_num, full_content)
+        return full_content, result
+
     def _handle_arbitration(self, arbitration, write_result: Dict):
         """处理仲裁结果"""
         from agents.creative_director import Decision
@@ -695,23 +727,15 @@ class Orchestrator:
 
         # 使用流式重写
         full_content = ""
+        content_parts: List[str] = []
         result = None
 
         try:
             # 获取流式生成器
             stream_gen = self.emotion_writer.write_chapter_stream(context, "")
 
-            # 迭代流式响应
-            for chunk_text, chunk_result in stream_gen:
-                if chunk_result is not None:
-                    # 收到最终结果
-                    result = chunk_result
-                elif chunk_text:
-                    # 收到文本块
-                    full_content += chunk_text
-                    # 触发流式文本回调
-                    if self.on_text_stream:
-                        self.on_text_stream(chunk_text)
+            # 迭代流式响应（文本块边收边写入 .partial 文件）
+            full_content, result = self._consume_stream(chapter, stream_gen, content_parts)
 
             # 如果没有收到最终结果（兼容模式），构造一个
             if result is None:
@@ -729,7 +753,7 @@ class Orchestrator:
                 "success": False,
                 "chapter": chapter,
                 "error": str(e),
-                "content": full_content
+                "content": "".join(content_parts)
             }
 
         # 重置状态
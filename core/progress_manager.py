@@ -3,12 +3,25 @@
 [ICON] Anthropic [ICON] claude-progress.txt [ICON]
 """
 
-import json
 import os
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 
+if __package__:
+    from .json_io import json_loads, json_dumps
+else:
+    from json_io import json_loads, json_dumps
+
+# 进度报告中各章节状态对应的图标
+STATUS_ICONS = {
+    'pending': '⏳',
+    'writing': '[WRITE][ICON]',
+    'reviewing': '[ICON]',
+    'completed': '[OK]',
+    'revision_needed': '[TOOL]'
+}
+
 
 @dataclass
 class ChapterProgress:
@@ -25,6 +38,7 @@ class ChapterProgress:
     errors: list = None
     warnings: list = None
     opening_diagnosis_grade: str = None
+    ending: str = ""  # 章节结尾（最后500字），供下一章衔接使用
 
     def __post_init__(self):
         if self.errors is None:
@@ -69,6 +83,12 @@ class ProgressManager:
         self.project_dir = project_dir
         self.progress_file = os.path.join(project_dir, progress_file)
         self.progress: Optional[NovelProgress] = None
+        # 汇总字段是否已与章节列表同步；同步后按单章差值增量更新
+        self._aggregates_ready = False
+        # 第一个 pending 章节的下标（None 表示没有待写章节）
+        self._next_pending: Optional[int] = None
+        # 最近一次加载/保存时进度文件的 (mtime_ns, size)，未变化时 load_progress 直接复用内存对象
+        self._file_signature: Optional[tuple] = None
         
     def initialize_progress(self, title: str, genre: str, total_chapters: int, 
                           chapter_titles: List[str]) -> NovelProgress:
@@ -88,24 +108,31 @@ class ProgressManager:
             total_chapters=total_chapters,
             chapters=chapters
         )
+        self._aggregates_ready = False
         
         self._save_progress()
         return self.progress
     
     def load_progress(self) -> Optional[NovelProgress]:
         """[ICON]"""
-        if not os.path.exists(self.progress_file):
+        signature = self._stat_progress_file()
+        if signature is None:
             return None
+        if self.progress is not None and signature == self._file_signature:
+            return self.progress
             
         try:
-            with open(self.progress_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.progress_file, 'rb') as f:
+                raw = f.read()
+            data = json_loads(raw)
             
             # [ICON]
             chapters_data = data.pop('chapters', [])
             chapters = [ChapterProgress(**ch) for ch in chapters_data]
             
             self.progress = NovelProgress(chapters=chapters, **data)
+            self._aggregates_ready = False
+            self._file_signature = signature
             return self.progress
         except Exception as e:
             print(f"[ICON]: {e}")
@@ -121,29 +148,46 @@ class ProgressManager:
         # [ICON]
         data = asdict(self.progress)
         
-        with open(self.progress_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        raw = json_dumps(data)
+        with open(self.progress_file, 'wb') as f:
+            f.write(raw)
+        self._file_signature = self._stat_progress_file()
+
+    def _stat_progress_file(self) -> Optional[tuple]:
+        """返回进度文件的 (mtime_ns, size)，文件不存在时返回 None"""
+        try:
+            st = os.stat(self.progress_file)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
     
     def update_chapter_progress(self, chapter_number: int, **kwargs):
         """[ICON]"""
         if not self.progress:
             return
             
-        for chapter in self.progress.chapters:
+        # 本次更新的完成时间与 last_updated 共用同一时间戳
+        now_iso = datetime.now().isoformat()
+        updated = None
+        for i, chapter in enumerate(self.progress.chapters):
             if chapter.chapter_number == chapter_number:
+                updated = (i, chapter.status, chapter.word_count)
                 for key, value in kwargs.items():
                     if hasattr(chapter, key):
                         setattr(chapter, key, value)
                 
                 if kwargs.get('status') == 'completed':
-                    chapter.completed_at = datetime.now().isoformat()
+                    chapter.completed_at = now_iso
                 break
         
-        # [ICON]
-        self._update_overall_progress()
+        # 汇总已同步时只应用本章的差值，否则全量重算一次
+        if self._aggregates_ready and updated:
+            self._apply_chapter_delta(*updated, now_iso=now_iso)
+        else:
+            self._update_overall_progress(now_iso)
         self._save_progress()
     
-    def _update_overall_progress(self):
+    def _update_overall_progress(self, now_iso: Optional[str] = None):
         """[ICON]"""
         if not self.progress:
             return
@@ -151,15 +195,47 @@ class ProgressManager:
         completed = sum(1 for ch in self.progress.chapters if ch.status == 'completed')
         self.progress.completed_chapters = completed
         self.progress.total_word_count = sum(ch.word_count for ch in self.progress.chapters)
-        self.progress.last_updated = datetime.now().isoformat()
+        self.progress.last_updated = now_iso or datetime.now().isoformat()
         
         # [ICON]
-        for ch in self.progress.chapters:
+        self._next_pending = None
+        for i, ch in enumerate(self.progress.chapters):
             if ch.status == 'pending':
+                self._next_pending = i
                 self.progress.current_chapter = ch.chapter_number
                 break
         
-        # [ICON]
+        self._update_overall_status()
+        self._aggregates_ready = True
+
+    def _apply_chapter_delta(self, index: int, old_status: str, old_word_count: int,
+                             now_iso: Optional[str] = None):
+        """按单章新旧状态/字数的差值更新汇总，避免每次遍历全部章节"""
+        p = self.progress
+        chapter = p.chapters[index]
+
+        p.completed_chapters += (chapter.status == 'completed') - (old_status == 'completed')
+        p.total_word_count += chapter.word_count - old_word_count
+        p.last_updated = now_iso or datetime.now().isoformat()
+
+        # 第一个 pending 章节只可能因本章状态变化而移动
+        if chapter.status == 'pending':
+            if self._next_pending is None or index < self._next_pending:
+                self._next_pending = index
+        elif old_status == 'pending' and index == self._next_pending:
+            self._next_pending = next(
+                (i for i in range(index + 1, len(p.chapters))
+                 if p.chapters[i].status == 'pending'),
+                None
+            )
+        if self._next_pending is not None:
+            p.current_chapter = p.chapters[self._next_pending].chapter_number
+
+        self._update_overall_status()
+
+    def _update_overall_status(self):
+        """根据已完成章节数更新整体状态"""
+        completed = self.progress.completed_chapters
         if completed == self.progress.total_chapters:
             self.progress.status = 'completed'
         elif completed > 0:
@@ -208,24 +284,20 @@ class ProgressManager:
 [ICON]:
 """
         
+        # 各章节行先收集到列表，最后一次性拼接，避免长篇小说逐章 += 反复复制整份报告
+        lines = [report]
         for ch in p.chapters:
-            status_icon = {
-                'pending': '⏳',
-                'writing': '[WRITE][ICON]',
-                'reviewing': '[ICON]',
-                'completed': '[OK]',
-                'revision_needed': '[TOOL]'
-            }.get(ch.status, '[ICON]')
+            status_icon = STATUS_ICONS.get(ch.status, '[ICON]')
             
-            report += f"  {status_icon} [ICON]{ch.chapter_number}[ICON]: {ch.title} - {ch.status}"
+            line = f"  {status_icon} [ICON]{ch.chapter_number}[ICON]: {ch.title} - {ch.status}"
             if ch.word_count > 0:
-                report += f" ({ch.word_count}[ICON])"
+                line += f" ({ch.word_count}[ICON])"
             if ch.quality_score > 0:
-                report += f" [[ICON]:{ch.quality_score:.1f}]"
-            report += "\n"
+                line += f" [[ICON]:{ch.quality_score:.1f}]"
+            lines.append(line + "\n")
         
-        report += "="*60
-        return report
+        lines.append("="*60)
+        return "".join(lines)
     
     def is_novel_complete(self) -> bool:
         """[ICON]"""
@@ -9,7 +9,7 @@ Prompt Assembler - Prompt聚合层
 import os
 import json
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 import logging
@@ -53,6 +53,9 @@ class PromptAssembler:
         # 状态管理器（延迟初始化）
         self.state_manager = None
 
+        # 角色设定注入段缓存: ((mtime_ns, size), 格式化文本)，characters.json 未变化时直接复用
+        self._characters_section_cache: Optional[Tuple[Tuple[int, int], str]] = None
+
     def _get_state_manager(self):
         """获取或初始化状态管理器"""
         if self.state_manager is None:
@@ -229,10 +232,18 @@ class PromptAssembler:
             return ""
 
         try:
+            # 角色设定在整个写作过程中基本不变，格式化结果按文件 (mtime, size) 缓存
+            st = characters_file.stat()
+            key = (st.st_mtime_ns, st.st_size)
+            cached = self._characters_section_cache
+            if cached is not None and cached[0] == key:
+                return cached[1]
+
             with open(characters_file, "r", encoding="utf-8") as f:
                 characters = json.load(f)
 
             if not characters:
+                self._characters_section_cache = (key, "")
                 return ""
 
             # 格式化角色信息（提取商业标签和声线标签）
@@ -270,6 +281,7 @@ class PromptAssembler:
 {characters_text}
 
 """
+            self._characters_section_cache = (key, injected)
             return injected
 
         except Exception as e:
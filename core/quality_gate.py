@@ -77,6 +77,8 @@ class QualityGate:
         self.project_dir = Path(project_dir)
         self.llm_client = llm_client
         self.skill_context_bus = skill_context_bus
+        # Auditor 阶段的滑动窗口检查结果: chapter_number -> 结果，供写作流程复用
+        self._window_results: Dict[int, Dict[str, Any]] = {}
 
         # 延迟导入避免循环依赖
         from core.writing_constraint_manager import WritingConstraintManager
@@ -159,6 +161,7 @@ class QualityGate:
                 before_chapter=chapter_number,
                 skeletons=recent_skeletons
             )
+            self._window_results[chapter_number] = result
             if not result.get("passed", True):
                 raise QualityViolationException(
                     violations=[{
@@ -177,6 +180,10 @@ class QualityGate:
 
         return True
 
+    def pop_window_result(self, chapter_number: int) -> Optional[Dict[str, Any]]:
+        """取出该章 Auditor 阶段的滑动窗口检查结果（未执行过则返回 None）"""
+        return self._window_results.pop(chapter_number, None)
+
     def validate_or_raise(self, chapter_number: int, content: str) -> Dict[str, Any]:
         """
         统一验证接口（兼容旧代码）
@@ -11,12 +11,16 @@ Writing Constraint Manager
 """
 
 import yaml
-import json
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass, asdict
 
+if __package__:
+    from .json_io import json_loads, json_dumps
+else:
+    from json_io import json_loads, json_dumps
+
 # 配置日志
 logger = logging.getLogger(__name__)
 
@@ -89,6 +93,8 @@ class WritingConstraintManager:
         self.config_file = Path("config/consistency_rules.yaml")
         self.constraints_file = self.project_dir / "writing_constraints.json"
         self.config = self._load_config()
+        # 约束提示词缓存: (约束对象, 提示词)，约束保存时失效
+        self._prompt_cache: Optional[Tuple[WritingConstraints, str]] = None
         self.constraints = self._load_or_create_constraints()
 
     def _load_config(self) -> Dict:
@@ -101,9 +107,8 @@ class WritingConstraintManager:
     def _load_or_create_constraints(self) -> WritingConstraints:
         """加载或创建约束"""
         if self.constraints_file.exists():
-            with open(self.constraints_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return WritingConstraints(**data)
+            data = json_loads(self.constraints_file.read_bytes())
+            return WritingConstraints(**data)
 
         # 从项目文件中提取初始约束
         constraints = self._extract_initial_constraints()
@@ -205,20 +210,18 @@ class WritingConstraintManager:
         """加载角色信息"""
         char_file = self.project_dir / "characters.json"
         if char_file.exists():
-            with open(char_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    return data
-                elif isinstance(data, dict):
-                    return data.get("characters", [])
+            data = json_loads(char_file.read_bytes())
+            if isinstance(data, list):
+                return data
+            elif isinstance(data, dict):
+                return data.get("characters", [])
         return []
 
     def _load_world_rules(self) -> Dict:
         """加载世界观规则"""
         rules_file = self.project_dir / "world-rules.json"
         if rules_file.exists():
-            with open(rules_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return json_loads(rules_file.read_bytes())
         return {}
 
     def _detect_initial_realm(self, characters: List[Dict]) -> str:
@@ -238,16 +241,26 @@ class WritingConstraintManager:
 
     def _save_constraints(self, constraints: WritingConstraints):
         """保存约束到文件"""
-        with open(self.constraints_file, "w", encoding="utf-8") as f:
-            json.dump(asdict(constraints), f, ensure_ascii=False, indent=2)
+        self._prompt_cache = None
+        self.constraints_file.write_bytes(json_dumps(asdict(constraints)))
 
     def get_constraint_prompt(self, chapter_number: int) -> str:
         """
         获取写作约束提示词
 
-        这个提示词会被添加到writer_agent的提示词中，强制LLM遵守约束
+        这个提示词会被添加到writer_agent的提示词中，强制LLM遵守约束。
+        提示词只取决于当前约束状态（每个检查点都会调用），约束未变化时直接复用。
         """
         c = self.constraints
+        if self._prompt_cache is not None and self._prompt_cache[0] is c:
+            return self._prompt_cache[1]
+
+        prompt = self._build_constraint_prompt(c)
+        self._prompt_cache = (c, prompt)
+        return prompt
+
+    def _build_constraint_prompt(self, c: WritingConstraints) -> str:
+        """根据约束状态构建提示词"""
 
         prompt = f"""
 ## 【强制写作约束】违反以下约束将导致设定崩坏，必须严格遵守：
@@ -3,6 +3,7 @@
 """
 
 import os
+import re
 from pathlib import Path
 from typing import Dict, List
 from datetime import datetime
@@ -161,6 +162,7 @@ class MiniAgentBadge(QFrame):
     def __init__(self, name: str, emoji: str):
         super().__init__()
         self.agent_name = name
+        self._status_color = None  # 最近一次应用的状态颜色
         self.setFixedHeight(40)
         self.setStyleSheet(f"background-color: {CyberpunkTheme.BG_LIGHT}; border: 1px solid {CyberpunkTheme.BORDER_COLOR}; border-radius: 6px;")
         self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
@@ -187,6 +189,10 @@ class MiniAgentBadge(QFrame):
         self.clicked.emit(self.agent_name)
 
     def set_status(self, color_hex: str):
+        # 颜色未变化时不重复设置样式表（每次 setStyleSheet 都会触发整棵子控件重新 polish）
+        if color_hex == self._status_color:
+            return
+        self._status_color = color_hex
         self.status_dot.setStyleSheet(f"color: {color_hex}; font-size: 14px; border: none; background: transparent;")
         # 工作时给边框发光
         if color_hex != CyberpunkTheme.FG_SUCCESS:
@@ -203,6 +209,14 @@ class MinimalistBadge(QFrame):
 
     card_clicked = pyqtSignal(str)
 
+    # 状态 -> 灯条颜色
+    STATUS_COLORS = {
+        "idle": CyberpunkTheme.FG_SUCCESS, "thinking": CyberpunkTheme.FG_INFO,
+        "writing": CyberpunkTheme.FG_PRIMARY, "auditing": CyberpunkTheme.FG_ACCENT,
+        "conflict": CyberpunkTheme.FG_DANGER, "error": CyberpunkTheme.FG_DANGER,
+        "suspended": CyberpunkTheme.FG_WARNING
+    }
+
     def __init__(self, name: str, role: str, description: str,
                  avatar_path: str = None, emoji: str = "🤖", parent=None):
         super().__init__(parent)
@@ -214,6 +228,7 @@ class MinimalistBadge(QFrame):
         self.current_status = "idle"
         self.current_task = ""
         self.is_back = False
+        self._applied_status = None  # 最近一次应用的 (状态, 任务)
 
         # 尺寸设定 (纵向ID卡)
         self.BADGE_WIDTH = 220
@@ -393,13 +408,12 @@ class MinimalistBadge(QFrame):
             self.shadow.setColor(QColor(0, 0, 0, 100))
 
     def set_status(self, status: str, task: str = ""):
-        colors = {
-            "idle": CyberpunkTheme.FG_SUCCESS, "thinking": CyberpunkTheme.FG_INFO,
-            "writing": CyberpunkTheme.FG_PRIMARY, "auditing": CyberpunkTheme.FG_ACCENT,
-            "conflict": CyberpunkTheme.FG_DANGER, "error": CyberpunkTheme.FG_DANGER,
-            "suspended": CyberpunkTheme.FG_WARNING
-        }
-        color = colors.get(status.lower(), CyberpunkTheme.FG_SUCCESS)
+        # 状态与任务均未变化时跳过，避免重复替换并应用整张正面样式表
+        if (status, task) == self._applied_status:
+            return
+        self._applied_status = (status, task)
+
+        color = self.STATUS_COLORS.get(status.lower(), CyberpunkTheme.FG_SUCCESS)
 
         # 变色灯条
         self.front.setStyleSheet(self.front_style.replace(CyberpunkTheme.FG_SUCCESS, color))
@@ -956,6 +970,15 @@ class LogPanel(QWidget):
         "system": "⚡",
     }
 
+    # 日志级别颜色映射
+    LEVEL_COLORS = {
+        "info": CyberpunkTheme.TEXT_SECONDARY,
+        "warning": CyberpunkTheme.FG_WARNING,
+        "error": CyberpunkTheme.FG_DANGER,
+        "success": CyberpunkTheme.FG_SUCCESS,
+        "system": CyberpunkTheme.FG_PRIMARY,
+    }
+
     # 关键字高亮颜色
     KEYWORD_COLORS = {
         "PASS": CyberpunkTheme.FG_SUCCESS,
@@ -971,6 +994,13 @@ class LogPanel(QWidget):
         "auditing": CyberpunkTheme.FG_ACCENT,
     }
 
+    # 关键字替换后的高亮片段，以及匹配全部关键字的预编译正则（各关键字互不包含）
+    _KEYWORD_SPANS = {
+        keyword: f'<span style="color: {color}; font-weight: bold;">{keyword}</span>'
+        for keyword, color in KEYWORD_COLORS.items()
+    }
+    _KEYWORD_PATTERN = re.compile("|".join(map(re.escape, KEYWORD_COLORS)))
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.log_count = 0
@@ -1077,7 +1107,11 @@ class LogPanel(QWidget):
                 border-color: {CyberpunkTheme.FG_PRIMARY};
             }}
         """)
-        self.search_box.textChanged.connect(self._apply_filters)
+        # 搜索框输入防抖：停止输入 300ms 后才重绘日志，避免每个按键都全量重建
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.timeout.connect(self._apply_filters)
+        self.search_box.textChanged.connect(lambda: self._search_timer.start(300))
         header_layout.addWidget(self.search_box)
 
         # 清空按钮
@@ -1153,18 +1187,15 @@ class LogPanel(QWidget):
         self.level_filter = level
         for lvl, btn in self.level_buttons.items():
             btn.setChecked(lvl == level)
+        # 追加日志改为增量显示后，切换级别需主动重建
+        self._apply_filters()
 
     def highlight_keywords(self, message: str) -> str:
-        """高亮关键字"""
-        result = message
-        for keyword, color in self.KEYWORD_COLORS.items():
-            # 使用正则表达式替换，保留原文本
-            if keyword in result:
-                result = result.replace(
-                    keyword,
-                    f'<span style="color: {color}; font-weight: bold;">{keyword}</span>'
-                )
-        return result
+        """高亮关键字（单个正则一次扫描完成全部关键字替换）"""
+        return self._KEYWORD_PATTERN.sub(self._keyword_span, message)
+
+    def _keyword_span(self, match) -> str:
+        return self._KEYWORD_SPANS[match.group(0)]
 
     def append_log(self, message: str, level: str = "info", agent: str = None):
         """追加日志 - v2.0 增强版（支持搜索过滤）"""
@@ -1183,66 +1214,68 @@ class LogPanel(QWidget):
         if len(self.all_logs) > self.max_logs:
             self.all_logs = self.all_logs[-self.max_logs:]
 
-        # 应用过滤并显示
-        self._apply_filters()
+        # 只追加这一条；显示区累积超出上限 10% 时才全量重建一次，裁掉已淘汰的旧日志
+        if self.log_count >= self.max_logs + self.max_logs // 10:
+            self._apply_filters()
+        elif self._matches_filters(log_entry, self.filter_combo.currentText(), self.search_box.text().lower()):
+            self.log_count += 1
+            self.log_text.append(self._format_log_html(log_entry))
+            scrollbar = self.log_text.verticalScrollBar()
+            scrollbar.setValue(scrollbar.maximum())
 
         # 更新计数
         self.count_label.setText(f"{len(self.all_logs)} entries")
 
-    def _apply_filters(self):
-        """应用过滤条件"""
-        # 获取过滤条件
-        current_filter = self.filter_combo.currentText()
-        search_text = self.search_box.text().lower() if hasattr(self, 'search_box') else ""
-
-        # 清空当前显示
-        self.log_text.clear()
-        self.log_count = 0
+    def _matches_filters(self, log: dict, current_filter: str, search_text: str) -> bool:
+        """判断单条日志是否满足当前 Agent/级别/搜索 过滤条件"""
+        # Agent过滤
+        if current_filter != "全部" and log["agent"] and log["agent"] != current_filter:
+            return False
 
-        # 级别颜色映射
-        colors = {
-            "info": CyberpunkTheme.TEXT_SECONDARY,
-            "warning": CyberpunkTheme.FG_WARNING,
-            "error": CyberpunkTheme.FG_DANGER,
-            "success": CyberpunkTheme.FG_SUCCESS,
-            "system": CyberpunkTheme.FG_PRIMARY,
-        }
+        # 级别过滤
+        if self.level_filter != "all" and log["level"] != self.level_filter:
+            return False
 
-        # 过滤并显示
-        for log in self.all_logs:
-            # Agent过滤
-            if current_filter != "全部" and log["agent"] and log["agent"] != current_filter:
-                continue
+        # 搜索过滤
+        if search_text and search_text.lower() not in log["message"].lower():
+            return False
 
-            # 级别过滤
-            if self.level_filter != "all" and log["level"] != self.level_filter:
-                continue
+        return True
 
-            # 搜索过滤
-            if search_text and search_text.lower() not in log["message"].lower():
-                continue
+    def _format_log_html(self, log: dict) -> str:
+        """构建单条日志的HTML"""
+        level = log["level"]
+        icon = self.LEVEL_ICONS.get(level, "•")
+        color = self.LEVEL_COLORS.get(level, CyberpunkTheme.TEXT_SECONDARY)
 
-            self.log_count += 1
+        agent_html = ""
+        if log["agent"]:
+            agent_html = f'<span style="color: {CyberpunkTheme.FG_ACCENT}; font-weight: bold;">[{log["agent"]}]</span> '
 
-            # 构建HTML
-            level = log["level"]
-            icon = self.LEVEL_ICONS.get(level, "•")
-            color = colors.get(level, CyberpunkTheme.TEXT_SECONDARY)
+        highlighted_message = self.highlight_keywords(log["message"])
 
-            agent_html = ""
-            if log["agent"]:
-                agent_html = f'<span style="color: {CyberpunkTheme.FG_ACCENT}; font-weight: bold;">[{log["agent"]}]</span> '
+        html = f'<div style="margin: 2px 0;">'
+        html += f'<span style="color: {CyberpunkTheme.TEXT_DIM};">{icon} [{log["timestamp"]}]</span> '
+        if agent_html:
+            html += agent_html
+        html += f'<span style="color: {color};">{highlighted_message}</span>'
+        html += '</div>'
+        return html
 
-            highlighted_message = self.highlight_keywords(log["message"])
+    def _apply_filters(self):
+        """应用过滤条件"""
+        # 获取过滤条件
+        current_filter = self.filter_combo.currentText()
+        search_text = self.search_box.text().lower() if hasattr(self, 'search_box') else ""
 
-            html = f'<div style="margin: 2px 0;">'
-            html += f'<span style="color: {CyberpunkTheme.TEXT_DIM};">{icon} [{log["timestamp"]}]</span> '
-            if agent_html:
-                html += agent_html
-            html += f'<span style="color: {color};">{highlighted_message}</span>'
-            html += '</div>'
+        # 先拼接全部条目，最后一次性 setHtml，避免逐条 append 触发重复排版
+        html_parts = [
+            self._format_log_html(log) for log in self.all_logs
+            if self._matches_filters(log, current_filter, search_text)
+        ]
+        self.log_count = len(html_parts)
 
-            self.log_text.append(html)
+        self.log_text.setHtml("".join(html_parts))
 
         # 自动滚动到底部
         scrollbar = self.log_text.verticalScrollBar()
@@ -4,6 +4,7 @@
 
 import os
 import json
+import time
 from pathlib import Path
 from typing import List
 
@@ -35,6 +36,8 @@ try:
 except ImportError:
     from components import AutoSaveIndicator, EvaluationCard
 
+from core.json_io import json_loads
+
 
 # ============================================================================
 # 进度检测与恢复对话框
@@ -147,8 +150,9 @@ class ProgressResumeDialog(QDialog):
 
         if progress_file.exists():
             try:
-                with open(progress_file, 'r', encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(progress_file, 'rb') as f:
+                    raw = f.read()
+                data = json_loads(raw)
 
                 self.completed_chapters = data.get('completed_chapters', 0)
                 self.total_chapters = data.get('total_chapters', 0)
@@ -824,8 +828,15 @@ class SettingsDialog(QDialog):
         "kimi-for-coding (Kimi 编程版)",
     ]
 
+    # 连接测试结果缓存：(模型, 密钥名, 密钥) -> (时间, 响应)，保存设置时清空
+    CONNECTION_TEST_TTL = 300
+    _connection_test_cache = {}
+    # 运行中的连接测试线程：对话框关闭后仍持有引用，线程结束时才释放
+    _running_tests = set()
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.test_worker = None
         self.init_ui()
         self.load_current_settings()
 
@@ -952,9 +963,9 @@ class SettingsDialog(QDialog):
         # 按钮区域
         btn_layout = QHBoxLayout()
 
-        test_btn = QPushButton("🔗 测试连接")
-        test_btn.clicked.connect(self.test_connection)
-        btn_layout.addWidget(test_btn)
+        self.test_btn = QPushButton("🔗 测试连接")
+        self.test_btn.clicked.connect(self.test_connection)
+        btn_layout.addWidget(self.test_btn)
 
         btn_layout.addStretch()
 
@@ -1016,7 +1027,6 @@ class SettingsDialog(QDialog):
         """测试API连接"""
         try:
             from core.config_manager import check_api_key, get_api_key
-            from core.model_manager import create_model_manager
             from core.config_manager import load_env_file
 
             available_keys = []
@@ -1045,34 +1055,84 @@ class SettingsDialog(QDialog):
                 )
                 return
 
-            llm = create_model_manager(model_id)
-            result = llm.generate("Say 'OK' if you receive this message.", temperature=0)
+            # 同一模型/密钥在有效期内直接复用上次成功的测试结果
+            cache_key = (model_id, key_name, api_key)
+            cached = self._connection_test_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < self.CONNECTION_TEST_TTL:
+                self._show_connection_success(model_id, key_name, cached[1])
+                return
 
-            QMessageBox.information(
-                self, "测试连接",
-                f"✅ 连接成功！\n\n模型: {model_id}\nAPI Key: {key_name[:10]}...\n响应: {result[:50]}...",
-                QMessageBox.StandardButton.Ok
+            # 在后台线程调用 API，避免阻塞界面
+            from ui.worker_thread import ConnectionTestWorker
+            self.test_btn.setEnabled(False)
+            self.test_btn.setText("⏳ 测试中...")
+            worker = ConnectionTestWorker(model_id)
+            worker.result_signal.connect(
+                lambda result: self._on_connection_tested(cache_key, result)
+            )
+            worker.error_signal.connect(
+                lambda error_msg: self._on_connection_failed(model_id, error_msg)
             )
+            self._running_tests.add(worker)
+            worker.finished.connect(lambda: self._running_tests.discard(worker))
+            worker.finished.connect(worker.deleteLater)
+            self.test_worker = worker
+            worker.start()
 
         except Exception as e:
-            error_msg = str(e)
-            if "Client.__init__()" in error_msg or "api key" in error_msg.lower():
-                error_msg = f"API Key可能无效或未正确配置\n\n详情: {error_msg}"
-            QMessageBox.critical(
-                self, "测试连接",
-                f"❌ 连接失败\n\n模型: {model_id}\n错误信息: {error_msg}",
-                QMessageBox.StandardButton.Ok
-            )
+            self._on_connection_failed(model_id, str(e))
+
+    def _on_connection_tested(self, cache_key: tuple, result: str):
+        """连接测试成功"""
+        self._reset_test_button()
+        # generate 以 "[错误]" 文本返回调用失败，这类结果不缓存
+        if not result.startswith("[错误]"):
+            self._connection_test_cache[cache_key] = (time.monotonic(), result)
+        self._show_connection_success(cache_key[0], cache_key[1], result)
+
+    def _show_connection_success(self, model_id: str, key_name: str, result: str):
+        QMessageBox.information(
+            self, "测试连接",
+            f"✅ 连接成功！\n\n模型: {model_id}\nAPI Key: {key_name[:10]}...\n响应: {result[:50]}...",
+            QMessageBox.StandardButton.Ok
+        )
+
+    def _on_connection_failed(self, model_id: str, error_msg: str):
+        """连接测试失败"""
+        self._reset_test_button()
+        if "Client.__init__()" in error_msg or "api key" in error_msg.lower():
+            error_msg = f"API Key可能无效或未正确配置\n\n详情: {error_msg}"
+        QMessageBox.critical(
+            self, "测试连接",
+            f"❌ 连接失败\n\n模型: {model_id}\n错误信息: {error_msg}",
+            QMessageBox.StandardButton.Ok
+        )
+
+    def done(self, result):
+        """关闭对话框时若连接测试仍在运行，断开其结果回调，线程在后台自行结束"""
+        if self.test_worker is not None:
+            self.test_worker.result_signal.disconnect()
+            self.test_worker.error_signal.disconnect()
+            self.test_worker = None
+        super().done(result)
+
+    def _reset_test_button(self):
+        self.test_worker = None
+        self.test_btn.setEnabled(True)
+        self.test_btn.setText("🔗 测试连接")
 
     def save_settings(self):
         """保存设置"""
         try:
-            from core.config_manager import save_api_key
+            from core.config_manager import save_api_keys, load_env_file
 
             # 获取.env文件路径
             current_dir = Path(__file__).parent.parent
             env_path = current_dir / ".env"
 
+            # 收集全部改动，最后只写一次.env
+            updates = {}
+
             # 保存模型设置
             selected_model = self.model_combo.currentText()
             model_id = selected_model.split(" ")[0]  # 提取模型ID
@@ -1090,8 +1150,8 @@ class SettingsDialog(QDialog):
             # 保存选中的模型
             for key, name in model_key_map.items():
                 if key in model_id.lower():
-                    save_api_key("DEFAULT_MODEL_ID", model_id, str(env_path))
-                    save_api_key("DEFAULT_MODEL_API_KEY", name, str(env_path))
+                    updates["DEFAULT_MODEL_ID"] = model_id
+                    updates["DEFAULT_MODEL_API_KEY"] = name
                     break
 
             # 保存API Keys
@@ -1102,9 +1162,16 @@ class SettingsDialog(QDialog):
 
                 # 跳过默认的掩码字符
                 if key_value and key_value != "••••••••••••••••":
-                    save_api_key(key_name, key_value, str(env_path))
+                    updates[key_name] = key_value
                     saved_count += 1
 
+            # 跳过与现有配置相同的值，全部未变化时不重写文件
+            current = load_env_file(str(env_path))
+            updates = {k: v for k, v in updates.items() if current.get(k) != v}
+            save_api_keys(updates, str(env_path))
+            if updates:
+                self._connection_test_cache.clear()
+
             if saved_count > 0:
                 QMessageBox.information(
                     self, "保存成功",
@@ -1219,38 +1286,36 @@ class DocumentViewerDialog(QDialog):
         # 添加大纲
         outline_file = project_path / "outline.md"
         if outline_file.exists():
-            self.file_list.addItem("📖 大纲 (outline.md)")
+            self._add_file_item("📖 大纲 (outline.md)", outline_file)
 
         # 添加人物
         chars_file = project_path / "characters.json"
         if chars_file.exists():
-            self.file_list.addItem("👤 人物设定 (characters.json)")
+            self._add_file_item("👤 人物设定 (characters.json)", chars_file)
 
         # 添加章节
         chapters_dir = project_path / "chapters"
         if chapters_dir.exists():
             chapter_files = sorted(chapters_dir.glob("chapter-*.md"))
             for cf in chapter_files:
-                chapter_num = cf.stem.replace("chapter-", "")
-                self.file_list.addItem(f"📄 第{chapter_num}章")
+                chapter_num = cf.stem[len("chapter-"):]
+                self._add_file_item(f"📄 第{chapter_num}章", cf)
+
+    def _add_file_item(self, text: str, file_path: Path):
+        """添加列表项，并把对应文件路径存入 UserRole，选中时无需再从文本反推路径"""
+        item = QListWidgetItem(text)
+        item.setData(Qt.ItemDataRole.UserRole, str(file_path))
+        self.file_list.addItem(item)
 
     def on_file_selected(self, row: int):
         """选择文件"""
         if row < 0:
             return
 
-        item_text = self.file_list.item(row).text()
-        project_path = Path(self.project_dir)
-
-        if "大纲" in item_text:
-            file_path = project_path / "outline.md"
-        elif "人物" in item_text:
-            file_path = project_path / "characters.json"
-        elif "第" in item_text and "章" in item_text:
-            chapter_num = item_text.replace("📄 第", "").replace("章", "")
-            file_path = project_path / "chapters" / f"chapter-{chapter_num}.md"
-        else:
+        stored_path = self.file_list.item(row).data(Qt.ItemDataRole.UserRole)
+        if not stored_path:
             return
+        file_path = Path(stored_path)
 
         if file_path.exists():
             try:
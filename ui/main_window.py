@@ -321,8 +321,8 @@ class ProducerDashboard(QMainWindow):
 
         try:
             # 创建 LLM 客户端
-            from core.model_manager import create_model_manager
-            llm_client = create_model_manager()
+            from core.model_manager import get_model_manager
+            llm_client = get_model_manager()
 
             if llm_client is None:
                 print("❌ 无法创建 LLM 客户端")
@@ -372,13 +372,15 @@ class ProducerDashboard(QMainWindow):
         # 2. 更新生产视图的项目目录（确保加载最新数据）
         self.view_prod.set_project_dir(self.project_dir)
 
-        # 3. 切换到生产视图
-        self.main_stack.setCurrentIndex(1)
-
-        # 4. 触发生产视图重新加载数据（确保大纲、人物等最新）
-        self.view_prod.reload_data()
+        # 3. 切换到生产视图并重新加载数据（确保大纲、人物等最新）
+        #    索引变化时 currentChanged -> _on_view_changed 已会 reload_data，
+        #    只有本就停留在生产视图时才需手动加载，避免重复读取项目文件
+        if self.main_stack.currentIndex() != 1:
+            self.main_stack.setCurrentIndex(1)
+        else:
+            self.view_prod.reload_data()
 
-        # 5. 触发生产视图的开始
+        # 4. 触发生产视图的开始
         self.view_prod.btn_start.click()
 
     # === AI 对话处理 ===
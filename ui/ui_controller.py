@@ -15,9 +15,19 @@ class UIDriver(QObject):
     接收并执行来自 AI 的结构化 UI 控制指令
     支持动态反射：根据变量名自动查找 UI 元素
     """
+    # 视图名称 -> main_stack 索引
+    VIEW_INDEX = {
+        "preprod": 0,
+        "production": 1,
+        "vault": 2,
+        "market": 3
+    }
+
     def __init__(self, dashboard):
         super().__init__()
         self.dashboard = dashboard
+        # 变量名 -> 拥有该属性的视图；记住所属视图而非元素本身，视图重建属性时仍取到最新控件
+        self._element_owner = {}
 
     def _find_ui_element(self, target_name: str):
         """
@@ -29,6 +39,10 @@ class UIDriver(QObject):
         Returns:
             UI 元素对象，如果未找到则返回 None
         """
+        owner = self._element_owner.get(target_name)
+        if owner is not None and hasattr(owner, target_name):
+            return getattr(owner, target_name)
+
         # 获取所有主视图
         views = [
             self.dashboard.view_preprod,
@@ -41,6 +55,7 @@ class UIDriver(QObject):
         for view in views:
             if view and hasattr(view, target_name):
                 element = getattr(view, target_name)
+                self._element_owner[target_name] = view
                 logger.debug(f"Found UI element: {target_name} in {view.__class__.__name__}")
                 return element
 
@@ -49,13 +64,7 @@ class UIDriver(QObject):
 
     def _switch_to_view(self, target: str):
         """切换视图"""
-        view_map = {
-            "preprod": 0,
-            "production": 1,
-            "vault": 2,
-            "market": 3
-        }
-        index = view_map.get(target, 0)
+        index = self.VIEW_INDEX.get(target, 0)
         self.dashboard.main_stack.setCurrentIndex(index)
         logger.info(f"Switched to view: {target} (index: {index})")
 
@@ -71,80 +80,93 @@ class UIDriver(QObject):
 
             logger.debug(f"Executing command: {action}, target: {target}")
 
-            if action == "switch_view":
-                self._switch_to_view(target)
-
-            elif action == "fill_text":
-                element = self._find_ui_element(target)
-
-                if element is None:
-                    logger.error(f"fill_text: Element '{target}' not found")
-                    continue
-
-                # 如果目标在 market 视图，先切换到 market 视图
-                if hasattr(self.dashboard.view_market, target):
-                    current_index = self.dashboard.main_stack.currentIndex()
-                    if current_index != 3:  # market 视图索引为 3
-                        self.dashboard.main_stack.setCurrentIndex(3)
-                        logger.info(f"fill_text: switched to market view for '{target}'")
-
-                # 切换到手动编辑页（如果目标在手动页）
-                if hasattr(self.dashboard.view_preprod, 'stack'):
-                    # 检查元素是否属于 preprod 视图
-                    preprod = self.dashboard.view_preprod
-                    if hasattr(preprod, target):
-                        preprod.stack.setCurrentIndex(1)
-
-                # 鸭子类型：检查元素类型并调用相应方法
-                if hasattr(element, "setText"):  # QLineEdit
-                    element.setText(content)
-                    logger.info(f"fill_text: setText on '{target}'")
-                elif hasattr(element, "setPlainText"):  # QTextEdit / QTextBrowser
-                    element.setPlainText(content)
-                    logger.info(f"fill_text: setPlainText on '{target}'")
-                elif hasattr(element, "setCurrentText"):  # QComboBox
-                    # 尝试查找匹配的选项
-                    idx = element.findText(content)
-                    if idx >= 0:
-                        element.setCurrentIndex(idx)
-                    else:
-                        element.setCurrentText(content)
-                    logger.info(f"fill_text: setCurrentText on '{target}'")
-                elif hasattr(element, "setHtml"):  # QTextBrowser (HTML)
-                    element.setHtml(content)
-                    logger.info(f"fill_text: setHtml on '{target}'")
-                else:
-                    logger.warning(f"fill_text: Element '{target}' doesn't support text filling")
-
-            elif action == "click_button":
-                element = self._find_ui_element(target)
-
-                if element is None:
-                    logger.error(f"click_button: Element '{target}' not found")
-                    continue
-
-                # 特殊处理 btn_create_skill：直接调用方法，避免 QTimer 延迟问题
-                if target == "btn_create_skill":
-                    # 查找 SkillMarketView 并直接调用创建方法
-                    market_view = self.dashboard.view_market
-                    if hasattr(market_view, '_on_create_skill_from_input'):
-                        logger.info(f"click_button: calling _on_create_skill_from_input")
-                        market_view._on_create_skill_from_input()
-                    continue
-
-                if hasattr(element, "click"):
-                    # 使用 QTimer 延迟点击，确保 UI 完全加载
-                    QTimer.singleShot(100, element.click)
-                    logger.info(f"click_button: clicked '{target}'")
-                else:
-                    logger.warning(f"click_button: Element '{target}' is not clickable")
-
-            elif action == "show_notification":
-                msg = content or cmd.get("message", "")
-                self.dashboard.global_status_bar.update_status(
-                    f"🤖 AI: {msg}", "info"
-                )
-                logger.info(f"show_notification: {msg}")
+            # 按指令名查表分发，未知指令忽略
+            handler = self.COMMAND_HANDLERS.get(action) if isinstance(action, str) else None
+            if handler:
+                getattr(self, handler)(cmd, target, content)
+
+    def _cmd_switch_view(self, cmd: dict, target: str, content: str):
+        self._switch_to_view(target)
+
+    def _cmd_fill_text(self, cmd: dict, target: str, content: str):
+        element = self._find_ui_element(target)
+
+        if element is None:
+            logger.error(f"fill_text: Element '{target}' not found")
+            return
+
+        # 如果目标在 market 视图，先切换到 market 视图
+        if hasattr(self.dashboard.view_market, target):
+            current_index = self.dashboard.main_stack.currentIndex()
+            if current_index != 3:  # market 视图索引为 3
+                self.dashboard.main_stack.setCurrentIndex(3)
+                logger.info(f"fill_text: switched to market view for '{target}'")
+
+        # 切换到手动编辑页（如果目标在手动页）
+        if hasattr(self.dashboard.view_preprod, 'stack'):
+            # 检查元素是否属于 preprod 视图
+            preprod = self.dashboard.view_preprod
+            if hasattr(preprod, target):
+                preprod.stack.setCurrentIndex(1)
+
+        # 鸭子类型：检查元素类型并调用相应方法
+        if hasattr(element, "setText"):  # QLineEdit
+            element.setText(content)
+            logger.info(f"fill_text: setText on '{target}'")
+        elif hasattr(element, "setPlainText"):  # QTextEdit / QTextBrowser
+            element.setPlainText(content)
+            logger.info(f"fill_text: setPlainText on '{target}'")
+        elif hasattr(element, "setCurrentText"):  # QComboBox
+            # 尝试查找匹配的选项
+            idx = element.findText(content)
+            if idx >= 0:
+                element.setCurrentIndex(idx)
+            else:
+                element.setCurrentText(content)
+            logger.info(f"fill_text: setCurrentText on '{target}'")
+        elif hasattr(element, "setHtml"):  # QTextBrowser (HTML)
+            element.setHtml(content)
+            logger.info(f"fill_text: setHtml on '{target}'")
+        else:
+            logger.warning(f"fill_text: Element '{target}' doesn't support text filling")
+
+    def _cmd_click_button(self, cmd: dict, target: str, content: str):
+        element = self._find_ui_element(target)
+
+        if element is None:
+            logger.error(f"click_button: Element '{target}' not found")
+            return
+
+        # 特殊处理 btn_create_skill：直接调用方法，避免 QTimer 延迟问题
+        if target == "btn_create_skill":
+            # 查找 SkillMarketView 并直接调用创建方法
+            market_view = self.dashboard.view_market
+            if hasattr(market_view, '_on_create_skill_from_input'):
+                logger.info(f"click_button: calling _on_create_skill_from_input")
+                market_view._on_create_skill_from_input()
+            return
+
+        if hasattr(element, "click"):
+            # 使用 QTimer 延迟点击，确保 UI 完全加载
+            QTimer.singleShot(100, element.click)
+            logger.info(f"click_button: clicked '{target}'")
+        else:
+            logger.warning(f"click_button: Element '{target}' is not clickable")
+
+    def _cmd_show_notification(self, cmd: dict, target: str, content: str):
+        msg = content or cmd.get("message", "")
+        self.dashboard.global_status_bar.update_status(
+            f"🤖 AI: {msg}", "info"
+        )
+        logger.info(f"show_notification: {msg}")
+
+    # 指令名 -> 处理方法
+    COMMAND_HANDLERS = {
+        "switch_view": "_cmd_switch_view",
+        "fill_text": "_cmd_fill_text",
+        "click_button": "_cmd_click_button",
+        "show_notification": "_cmd_show_notification",
+    }
 
 
 class UIRemoteServer(QThread):
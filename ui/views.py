@@ -2,6 +2,7 @@
 视图组件 - 全局状态栏、主导航栏、前期筹备视图、生产视图、项目仓库视图
 """
 
+import os
 import sys
 import json
 from pathlib import Path
@@ -37,6 +38,8 @@ except ImportError:
     from core.project_context import NovelProject
     from themes import CyberpunkTheme, Typography, Spacing
 
+from core.json_io import json_loads
+
 
 # ============================================================================
 # 全局状态栏 (Tier 2) - 仅显示信息，无操作按钮
@@ -839,10 +842,10 @@ class PreProductionView(QWidget):
 
         # 调用 LLM 进行诊断
         try:
-            from core.model_manager import ModelManager
+            from core.model_manager import get_model_manager
 
-            # 使用默认模型
-            mm = ModelManager()
+            # 使用默认模型（复用共享实例）
+            mm = get_model_manager()
 
             # 调用 API
             result = mm.generate(
@@ -1004,6 +1007,11 @@ class ProductionView(QWidget):
     status_changed = pyqtSignal(str)  # 状态变更信号
     save_config = pyqtSignal()       # 保存配置信号
 
+    # Agent 状态 -> 迷你工牌指示灯颜色
+    AGENT_STATUS_COLORS = {"idle": CyberpunkTheme.FG_SUCCESS, "thinking": CyberpunkTheme.FG_INFO,
+                           "writing": CyberpunkTheme.FG_PRIMARY, "auditing": CyberpunkTheme.FG_ACCENT,
+                           "conflict": CyberpunkTheme.FG_DANGER}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.project_dir = "novels/default"
@@ -1353,10 +1361,7 @@ class ProductionView(QWidget):
 
     def update_agent_status(self, name: str, status: str, task: str = ""):
         """更新 Agent 状态"""
-        colors = {"idle": CyberpunkTheme.FG_SUCCESS, "thinking": CyberpunkTheme.FG_INFO,
-                  "writing": CyberpunkTheme.FG_PRIMARY, "auditing": CyberpunkTheme.FG_ACCENT,
-                  "conflict": CyberpunkTheme.FG_DANGER}
-        color_hex = colors.get(status.lower(), CyberpunkTheme.FG_SUCCESS)
+        color_hex = self.AGENT_STATUS_COLORS.get(status.lower(), CyberpunkTheme.FG_SUCCESS)
 
         if name in self.large_badges:
             self.large_badges[name].set_status(status, task)
@@ -1388,6 +1393,81 @@ class ProductionView(QWidget):
         self.emotion_panel.update_curve(expected, actual, chapter, total)
 
 
+# ============================================================================
+# 项目列表缓存 - 以 (目录, 配置文件 mtime_ns) 签名判断是否需要重新解析
+# ============================================================================
+_projects_cache = {"signature": None, "entries": []}
+# 解析失败的项目配置 (项目路径, mtime_ns)，文件未修改前直接跳过
+_bad_project_configs = set()
+
+
+def _projects_signature(novels_dir: Path) -> tuple:
+    """单次 os.scandir 遍历项目目录，返回 ((项目路径, 配置 mtime_ns), ...)"""
+    signature = []
+    with os.scandir(novels_dir) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+            try:
+                mtime_ns = os.stat(os.path.join(entry.path, "project_config.json")).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            signature.append((entry.path, mtime_ns))
+    return tuple(signature)
+
+
+def _list_subdirs(parent: Path) -> list:
+    """按名称排序列出子目录 [(名称, 路径), ...]；DirEntry.is_dir() 复用目录项类型，无需逐个 stat"""
+    with os.scandir(parent) as it:
+        return sorted((entry.name, entry.path) for entry in it if entry.is_dir())
+
+
+# 章节正文缓存：路径 -> ((mtime_ns, size), 正文)，反复切换书籍时未修改的章节不再读盘
+_chapter_text_cache = {}
+
+
+def _read_chapter_text(path: str) -> str:
+    """读取章节正文，文件 (mtime_ns, size) 未变化时直接返回缓存内容"""
+    st = os.stat(path)
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _chapter_text_cache.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+    _chapter_text_cache[path] = (signature, content)
+    return content
+
+
+def _load_project_entries(signature: tuple) -> list:
+    """按签名读取项目配置，返回 [(列表文本, 项目路径), ...]；签名未变时不再读盘"""
+    if signature == _projects_cache["signature"]:
+        return _projects_cache["entries"]
+
+    entries = []
+    for project_path, mtime_ns in signature:
+        name = os.path.basename(project_path)
+        item_text = name
+        if mtime_ns is not None and (project_path, mtime_ns) not in _bad_project_configs:
+            config_file = os.path.join(project_path, "project_config.json")
+            try:
+                with open(config_file, "rb") as f:
+                    raw = f.read()
+                config = json_loads(raw)
+                title = config.get("title", name)
+                genre = config.get("genre", "未知")
+                item_text = f"{title}\n[{genre}]"
+            except (OSError, ValueError, AttributeError) as e:
+                # 损坏的配置只提示一次，文件修改前不再重复读取
+                _bad_project_configs.add((project_path, mtime_ns))
+                print(f"[WARN] 无法读取项目配置 {config_file}: {e}")
+        entries.append((item_text, project_path))
+
+    _projects_cache["signature"] = signature
+    _projects_cache["entries"] = entries
+    return entries
+
+
 # ============================================================================
 # 项目仓库视图 (ProjectVaultView)
 # ============================================================================
@@ -1397,6 +1477,7 @@ class ProjectVaultView(QWidget):
     def __init__(self, project_dir: str, parent=None):
         super().__init__(parent)
         self.project_dir = project_dir
+        self._shown_entries = None  # 当前列表对应的项目条目
         self.init_ui()
         self.load_projects()
 
@@ -1500,31 +1581,23 @@ class ProjectVaultView(QWidget):
 
     def load_projects(self):
         """加载所有项目"""
-        self.book_list.clear()
         novels_dir = Path("novels")
 
         if not novels_dir.exists():
             novels_dir.mkdir(parents=True)
 
-        for project in novels_dir.iterdir():
-            if project.is_dir():
-                # 尝试读取项目配置
-                config_file = project / "project_config.json"
-                if config_file.exists():
-                    try:
-                        with open(config_file, "r", encoding="utf-8") as f:
-                            config = json.load(f)
-                        title = config.get("title", project.name)
-                        genre = config.get("genre", "未知")
-                        item_text = f"{title}\n[{genre}]"
-                    except:
-                        item_text = project.name
-                else:
-                    item_text = project.name
+        # 目录与配置文件未变化时直接复用上次解析结果；
+        # 结果与当前列表相同时不重建控件，切回仓库视图也能保留当前选中的书籍
+        entries = _load_project_entries(_projects_signature(novels_dir))
+        if entries is self._shown_entries:
+            return
+        self._shown_entries = entries
 
-                item = QListWidgetItem(item_text)
-                item.setData(Qt.ItemDataRole.UserRole, str(project))
-                self.book_list.addItem(item)
+        self.book_list.clear()
+        for item_text, project_path in entries:
+            item = QListWidgetItem(item_text)
+            item.setData(Qt.ItemDataRole.UserRole, project_path)
+            self.book_list.addItem(item)
 
         if self.book_list.count() == 0:
             self.book_list.addItem("暂无项目，去前期筹备创建吧！")
@@ -1540,16 +1613,24 @@ class ProjectVaultView(QWidget):
         chapters_dir = Path(project_path) / "chapters"
 
         if chapters_dir.exists():
-            chapters = sorted(chapters_dir.glob("chapter_*.md"))
-            full_text = ""
-            for ch in chapters:
+            with os.scandir(chapters_dir) as it:
+                chapters = sorted(
+                    (entry.name, entry.path) for entry in it
+                    if entry.name.startswith("chapter_") and entry.name.endswith(".md")
+                )
+            # 收集各章后统一拼接/添加，避免字符串反复拼接和逐条插入列表
+            text_parts = []
+            names = []
+            for name, path in chapters:
                 try:
-                    content = ch.read_text(encoding="utf-8")
-                    full_text += f"\n\n{'='*50}\n{ch.stem}\n{'='*50}\n\n{content}"
-                    self.material_list.addItem(ch.name)
+                    content = _read_chapter_text(path)
+                    text_parts.append(f"\n\n{'='*50}\n{name[:-3]}\n{'='*50}\n\n{content}")
+                    names.append(name)
                 except:
                     pass
 
+            self.material_list.addItems(names)
+            full_text = "".join(text_parts)
             self.read_tab.setPlainText(full_text if full_text else "暂无内容")
 
 
@@ -1689,13 +1770,12 @@ class SkillMarketView(QWidget):
             lbl.setStyleSheet(f"color: {CyberpunkTheme.TEXT_SECONDARY}; font-weight: bold; font-size: 13px; font-family: Consolas;")
             self._grid.addWidget(lbl, row, 0, 1, 3)
             row += 1
-            for sp in sorted(builtin_dir.iterdir()):
-                if sp.is_dir():
-                    self._grid.addWidget(self._create_skill_card(sp.name, str(sp), False), row, col)
-                    col += 1
-                    if col >= 3:
-                        col = 0
-                        row += 1
+            for name, path in _list_subdirs(builtin_dir):
+                self._grid.addWidget(self._create_skill_card(name, path, False), row, col)
+                col += 1
+                if col >= 3:
+                    col = 0
+                    row += 1
             if col != 0:
                 col = 0
                 row += 1
@@ -1708,14 +1788,13 @@ class SkillMarketView(QWidget):
         self._grid.addWidget(lbl2, row, 0, 1, 3)
         row += 1
         has_custom = False
-        for sp in sorted(custom_dir.iterdir()):
-            if sp.is_dir():
-                has_custom = True
-                self._grid.addWidget(self._create_skill_card(sp.name, str(sp), True), row, col)
-                col += 1
-                if col >= 3:
-                    col = 0
-                    row += 1
+        for name, path in _list_subdirs(custom_dir):
+            has_custom = True
+            self._grid.addWidget(self._create_skill_card(name, path, True), row, col)
+            col += 1
+            if col >= 3:
+                col = 0
+                row += 1
         if not has_custom:
             hint = QLabel("暂无自定义技能，点击上方按钮创建")
             hint.setStyleSheet(f"color: {CyberpunkTheme.TEXT_DIM}; font-style: italic;")
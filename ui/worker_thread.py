@@ -164,8 +164,8 @@ class AgenticChatWorker(QThread):
 
     def run(self):
         try:
-            from core.model_manager import create_model_manager
-            mm = create_model_manager()
+            from core.model_manager import get_model_manager
+            mm = get_model_manager()
 
             system_prompt = """你是一个名为NovelForge的AI资深网文责编。你的任务是引导用户构建小说设定。
 你还可以控制用户的本地UI界面！当用户确认了某些设定时，请在JSON的 ui_commands 数组中下达指令。
@@ -240,8 +240,8 @@ class ToolWorker(QThread):
 
     def run(self):
         try:
-            from core.model_manager import create_model_manager
-            mm = create_model_manager()
+            from core.model_manager import get_model_manager
+            mm = get_model_manager()
             system_prompt = self.PROMPTS.get(self.tool_name, "你是一个网文创作助手。请根据关键词提供创意。")
             messages = [{"role": "user", "content": f"我的关键词/想法是：{self.keywords}"}]
             response = mm.chat(messages=messages, system_prompt=system_prompt, temperature=0.8)
@@ -250,6 +250,25 @@ class ToolWorker(QThread):
             self.error_signal.emit(f"生成失败: {str(e)}")
 
 
+class ConnectionTestWorker(QThread):
+    """API 连接测试 - 后台调用一次 LLM，避免阻塞设置对话框"""
+    result_signal = pyqtSignal(str)
+    error_signal = pyqtSignal(str)
+
+    def __init__(self, model_id: str):
+        super().__init__()
+        self.model_id = model_id
+
+    def run(self):
+        try:
+            from core.model_manager import get_model_manager
+            llm = get_model_manager(self.model_id)
+            result = llm.generate("Say 'OK' if you receive this message.", temperature=0)
+            self.result_signal.emit(result)
+        except Exception as e:
+            self.error_signal.emit(str(e))
+
+
 class GoldenThreeWorker(QThread):
     """黄金三章评估Worker - 异步调用LLM评估前三章"""
     result_signal = pyqtSignal(str)  # 评估结果HTML
@@ -262,7 +281,7 @@ class GoldenThreeWorker(QThread):
     def run(self):
         try:
             from pathlib import Path
-            from core.model_manager import create_model_manager
+            from core.model_manager import get_model_manager
 
             project_path = Path(self.project_dir)
             chapters_dir = project_path / "chapters"
@@ -309,7 +328,7 @@ class GoldenThreeWorker(QThread):
     "总体建议": "..."
 }}"""
 
-            mm = create_model_manager()
+            mm = get_model_manager()
             result = mm.generate(
                 prompt=evaluate_prompt,
                 temperature=0.7,